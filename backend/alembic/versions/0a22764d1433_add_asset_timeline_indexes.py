@@ -0,0 +1,42 @@
+"""add asset timeline indexes
+
+Revision ID: 0a22764d1433
+Revises: 907941d57507
+Create Date: 2026-10-18 15:52:37.418260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a22764d1433'
+down_revision: Union[str, Sequence[str], None] = '907941d57507'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_update_logs_asset_barcode_created_at', 'update_logs', ['asset_barcode', 'created_at', 'id']),
+    ('ix_service_histories_sn_or_barcode_service_date', 'service_histories', ['sn_or_barcode', 'service_date', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+        return
+
+    # CONCURRENTLY agar penulisan log & servis tidak terkunci selama index dibangun
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,42 @@
+"""add asset stats summary table
+
+Revision ID: 2a1acc9c43be
+Revises: b6161d33d46f
+Create Date: 2026-10-18 11:20:48.902177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a1acc9c43be'
+down_revision: Union[str, Sequence[str], None] = 'b6161d33d46f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('asset_stats',
+    sa.Column('school_id', sa.Integer(), nullable=False),
+    sa.Column('type_code', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('procurement_month', sa.String(), nullable=False),
+    sa.Column('asset_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['school_id'], ['schools.id'], ),
+    sa.PrimaryKeyConstraint('school_id', 'type_code', 'status', 'procurement_month')
+    )
+    # Isi awal dari data aset yang sudah ada
+    op.execute(
+        "INSERT INTO asset_stats (school_id, type_code, status, procurement_month, asset_count) "
+        "SELECT school_id, type_code, status, procurement_month, count(id) FROM assets "
+        "GROUP BY school_id, type_code, status, procurement_month"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('asset_stats')
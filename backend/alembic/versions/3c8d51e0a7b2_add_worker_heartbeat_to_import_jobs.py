@@ -0,0 +1,30 @@
+"""add worker heartbeat to import jobs
+
+Revision ID: 3c8d51e0a7b2
+Revises: 5ed4a2e93282
+Create Date: 2026-10-18 18:12:40.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8d51e0a7b2'
+down_revision: Union[str, Sequence[str], None] = '5ed4a2e93282'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('import_jobs', sa.Column('worker', sa.String(), nullable=True))
+    op.add_column('import_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('import_jobs', 'heartbeat_at')
+    op.drop_column('import_jobs', 'worker')
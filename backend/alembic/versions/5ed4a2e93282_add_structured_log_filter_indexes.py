@@ -0,0 +1,40 @@
+"""add structured log filter indexes
+
+Revision ID: 5ed4a2e93282
+Revises: f114bffb98cc
+Create Date: 2026-10-18 16:24:49.117036
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5ed4a2e93282'
+down_revision: Union[str, Sequence[str], None] = 'f114bffb98cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_update_logs_created_at', ['created_at', 'id']),
+    ('ix_update_logs_action_created_at', ['action', 'created_at', 'id']),
+    ('ix_update_logs_actor_created_at', ['actor', 'created_at', 'id']),
+    ('ix_update_logs_school_name_created_at', ['school_name', 'created_at', 'id']),
+    ('ix_update_logs_area_name_created_at', ['area_name', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tanpa CONCURRENTLY: PostgreSQL tidak mendukungnya untuk tabel partisi.
+    # Index di tabel induk otomatis dibuat di setiap partisi bulanan.
+    for name, columns in INDEXES:
+        op.create_index(name, 'update_logs', columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='update_logs')
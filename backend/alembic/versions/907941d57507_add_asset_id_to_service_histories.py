@@ -0,0 +1,49 @@
+"""add asset_id to service histories
+
+Revision ID: 907941d57507
+Revises: b75284112ba3
+Create Date: 2026-10-18 15:41:27.305516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '907941d57507'
+down_revision: Union[str, Sequence[str], None] = 'b75284112ba3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('service_histories', sa.Column('asset_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_service_histories_asset_id'), 'service_histories', ['asset_id'], unique=False)
+    op.create_foreign_key(
+        'fk_service_histories_asset_id_assets', 'service_histories', 'assets',
+        ['asset_id'], ['id'], ondelete='SET NULL'
+    )
+
+    # Isi asset_id data lama: cocokkan barcode dulu, lalu serial number
+    op.execute("""
+        UPDATE service_histories SET asset_id = (
+            SELECT assets.id FROM assets WHERE assets.barcode = service_histories.sn_or_barcode
+        )
+        WHERE asset_id IS NULL
+    """)
+    op.execute("""
+        UPDATE service_histories SET asset_id = (
+            SELECT MIN(assets.id) FROM assets WHERE assets.serial_number = service_histories.sn_or_barcode
+        )
+        WHERE asset_id IS NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_service_histories_asset_id_assets', 'service_histories', type_='foreignkey')
+    op.drop_index(op.f('ix_service_histories_asset_id'), table_name='service_histories')
+    op.drop_column('service_histories', 'asset_id')
@@ -0,0 +1,46 @@
+"""add composite indexes for asset filters
+
+Revision ID: b6161d33d46f
+Revises: e37574a4637b
+Create Date: 2026-10-18 10:41:05.276914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6161d33d46f'
+down_revision: Union[str, Sequence[str], None] = 'e37574a4637b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_assets_school_id_created_at', ['school_id', 'created_at', 'id']),
+    ('ix_assets_created_at', ['created_at', 'id']),
+    ('ix_assets_type_code_category_code', ['type_code', 'category_code']),
+    ('ix_assets_status', ['status']),
+    ('ix_assets_ip_address', ['ip_address']),
+    ('ix_assets_mac_address', ['mac_address']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns in INDEXES:
+            op.create_index(name, 'assets', columns, unique=False)
+        return
+
+    # CONCURRENTLY agar tabel assets tetap bisa ditulis selama index dibangun
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, 'assets', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='assets')
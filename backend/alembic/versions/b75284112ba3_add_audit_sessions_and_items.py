@@ -0,0 +1,70 @@
+"""add audit sessions and items
+
+Revision ID: b75284112ba3
+Revises: c69382444ab1
+Create Date: 2026-10-18 15:02:11.482917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b75284112ba3'
+down_revision: Union[str, Sequence[str], None] = 'c69382444ab1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('audit_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('school_id', sa.Integer(), nullable=False),
+    sa.Column('floor', sa.String(), nullable=True),
+    sa.Column('room', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('opened_by', sa.String(), nullable=True),
+    sa.Column('expected_count', sa.Integer(), nullable=False),
+    sa.Column('matched_count', sa.Integer(), nullable=False),
+    sa.Column('wrong_location_count', sa.Integer(), nullable=False),
+    sa.Column('unexpected_count', sa.Integer(), nullable=False),
+    sa.Column('unknown_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['school_id'], ['schools.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_audit_sessions_id'), 'audit_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_audit_sessions_school_id'), 'audit_sessions', ['school_id'], unique=False)
+    op.create_table('audit_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('asset_id', sa.Integer(), nullable=True),
+    sa.Column('barcode', sa.String(), nullable=True),
+    sa.Column('code', sa.String(), nullable=True),
+    sa.Column('expected', sa.Boolean(), nullable=False),
+    sa.Column('result', sa.String(), nullable=False),
+    sa.Column('scanned_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['session_id'], ['audit_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_audit_items_id'), 'audit_items', ['id'], unique=False)
+    op.create_index('ix_audit_items_session_id_asset_id', 'audit_items', ['session_id', 'asset_id'], unique=False)
+    op.create_index('ix_audit_items_session_id_result', 'audit_items', ['session_id', 'result'], unique=False)
+    op.create_index('ix_audit_items_session_id_code', 'audit_items', ['session_id', 'code'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_items_session_id_code', table_name='audit_items')
+    op.drop_index('ix_audit_items_session_id_result', table_name='audit_items')
+    op.drop_index('ix_audit_items_session_id_asset_id', table_name='audit_items')
+    op.drop_index(op.f('ix_audit_items_id'), table_name='audit_items')
+    op.drop_table('audit_items')
+    op.drop_index(op.f('ix_audit_sessions_school_id'), table_name='audit_sessions')
+    op.drop_index(op.f('ix_audit_sessions_id'), table_name='audit_sessions')
+    op.drop_table('audit_sessions')
@@ -0,0 +1,45 @@
+"""add trigram search indexes to assets
+
+Revision ID: e37574a4637b
+Revises: 0001b737a060
+Create Date: 2026-10-18 10:02:17.543118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e37574a4637b'
+down_revision: Union[str, Sequence[str], None] = '0001b737a060'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('barcode', 'serial_number', 'brand', 'model_series')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        for column in SEARCH_COLUMNS:
+            op.create_index(f'ix_assets_{column}_trgm', 'assets', [column], unique=False)
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY agar tabel assets tetap bisa ditulis selama index GIN dibangun
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'ix_assets_{column}_trgm', 'assets', [column], unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_assets_{column}_trgm', table_name='assets')
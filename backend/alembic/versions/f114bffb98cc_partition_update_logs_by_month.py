@@ -0,0 +1,115 @@
+"""partition update_logs by month
+
+Revision ID: f114bffb98cc
+Revises: 0a22764d1433
+Create Date: 2026-10-18 16:08:12.903514
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f114bffb98cc'
+down_revision: Union[str, Sequence[str], None] = '0a22764d1433'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+COLUMNS = 'id, asset_barcode, asset_name, school_name, area_name, action, details, actor, created_at'
+INDEXES = [
+    ('ix_update_logs_id', ['id']),
+    ('ix_update_logs_asset_barcode', ['asset_barcode']),
+    ('ix_update_logs_asset_barcode_created_at', ['asset_barcode', 'created_at', 'id']),
+]
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite / dev tetap memakai tabel biasa; arsip memakai DELETE per bulan sebagai fallback
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE update_logs RENAME TO update_logs_unpartitioned')
+    op.execute('ALTER TABLE update_logs_unpartitioned RENAME CONSTRAINT update_logs_pkey TO update_logs_unpartitioned_pkey')
+    op.execute('ALTER SEQUENCE update_logs_id_seq OWNED BY NONE')
+    # Primary key tabel partisi wajib memuat kolom partisi (created_at)
+    op.execute("""
+        CREATE TABLE update_logs (
+            id INTEGER NOT NULL DEFAULT nextval('update_logs_id_seq'),
+            asset_barcode VARCHAR,
+            asset_name VARCHAR,
+            school_name VARCHAR,
+            area_name VARCHAR,
+            action VARCHAR,
+            details VARCHAR,
+            actor VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute('CREATE TABLE update_logs_default PARTITION OF update_logs DEFAULT')
+
+    oldest = op.get_bind().execute(sa.text(
+        "SELECT (date_trunc('month', min(created_at) AT TIME ZONE 'UTC'))::date FROM update_logs_unpartitioned"
+    )).scalar()
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = min(oldest or current, current)
+    while month <= add_months(current, MONTHS_AHEAD):
+        op.execute(
+            f"CREATE TABLE update_logs_p{month:%Y%m} PARTITION OF update_logs "
+            f"FOR VALUES FROM ('{month_bound(month)}') TO ('{month_bound(add_months(month, 1))}')"
+        )
+        month = add_months(month, 1)
+
+    op.execute(
+        f'INSERT INTO update_logs ({COLUMNS}) '
+        f"SELECT {COLUMNS.replace('created_at', 'COALESCE(created_at, now())')} FROM update_logs_unpartitioned"
+    )
+    op.execute('DROP TABLE update_logs_unpartitioned')
+    op.execute('ALTER SEQUENCE update_logs_id_seq OWNED BY update_logs.id')
+
+    for name, columns in INDEXES:
+        op.create_index(name, 'update_logs', columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE update_logs RENAME TO update_logs_partitioned')
+    op.execute('ALTER TABLE update_logs_partitioned RENAME CONSTRAINT update_logs_pkey TO update_logs_partitioned_pkey')
+    op.execute('ALTER SEQUENCE update_logs_id_seq OWNED BY NONE')
+    op.execute("""
+        CREATE TABLE update_logs (
+            id INTEGER NOT NULL DEFAULT nextval('update_logs_id_seq'),
+            asset_barcode VARCHAR,
+            asset_name VARCHAR,
+            school_name VARCHAR,
+            area_name VARCHAR,
+            action VARCHAR,
+            details VARCHAR,
+            actor VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f'INSERT INTO update_logs ({COLUMNS}) SELECT {COLUMNS} FROM update_logs_partitioned')
+    op.execute('DROP TABLE update_logs_partitioned')
+    op.execute('ALTER SEQUENCE update_logs_id_seq OWNED BY update_logs.id')
+
+    for name, columns in INDEXES:
+        op.create_index(name, 'update_logs', columns, unique=False)
@@ -1,8 +1,8 @@
 from fastapi import Depends, HTTPException, status
-from app.models.user import User
+from app.schemas.user import UserPrincipal
 from app.api.v1.endpoints.auth import get_current_user
 
-def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+def get_current_admin(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -10,7 +10,7 @@ def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
         )
     return current_user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
\ No newline at end of file
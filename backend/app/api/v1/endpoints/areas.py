@@ -1,7 +1,9 @@
 from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy.orm import Session, joinedload
+from app.db.session import get_read_db
+from app.core.cache import locations_cache
+from app.core.http_cache import http_cache
 from app.models.location import Area, School
 from app.schemas.location import Area as AreaSchema
 from app.schemas.location import School as SchoolSchema
@@ -12,33 +14,50 @@ router = APIRouter()
 def read_areas(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    versions: tuple = Depends(http_cache("areas")),
+    db: Session = Depends(get_read_db)
 ):
     """
     Mengambil daftar semua Area (Pusat, Barat, Timur, dll).
     """
-    areas = db.query(Area).offset(skip).limit(limit).all()
-    return areas
+    def load():
+        areas = db.query(Area).offset(skip).limit(limit).all()
+        return [AreaSchema.model_validate(area) for area in areas]
+
+    return locations_cache.get_or_load(("areas", skip, limit, versions), load)
 
 @router.get("/{area_id}", response_model=AreaSchema)
-def read_area(area_id: int, db: Session = Depends(get_db)):
+def read_area(area_id: int, versions: tuple = Depends(http_cache("areas")), db: Session = Depends(get_read_db)):
     """
     Mengambil info satu Area spesifik.
     """
-    area = db.query(Area).filter(Area.id == area_id).first()
+    def load():
+        area = db.query(Area).filter(Area.id == area_id).first()
+        return AreaSchema.model_validate(area) if area else None
+
+    area = locations_cache.get_or_load(("area", area_id, versions), load)
     if not area:
         raise HTTPException(status_code=404, detail="Area not found")
     return area
 
 @router.get("/{area_id}/schools", response_model=List[SchoolSchema])
-def read_schools_by_area(area_id: int, db: Session = Depends(get_db)):
+def read_schools_by_area(
+    area_id: int,
+    versions: tuple = Depends(http_cache("areas", "schools")),
+    db: Session = Depends(get_read_db)
+):
     """
     Mengambil daftar sekolah berdasarkan Area ID.
     Contoh: Jika Area ID = 2 (Pusat), akan muncul SDK 1, SMAK 1, dll.
     """
-    area = db.query(Area).filter(Area.id == area_id).first()
-    if not area:
+    def load():
+        area = db.query(Area).filter(Area.id == area_id).first()
+        if not area:
+            return None
+        schools = db.query(School).options(joinedload(School.area)).filter(School.area_id == area_id).all()
+        return [SchoolSchema.model_validate(school) for school in schools]
+
+    schools = locations_cache.get_or_load(("area_schools", area_id, versions), load)
+    if schools is None:
         raise HTTPException(status_code=404, detail="Area not found")
-        
-    schools = db.query(School).filter(School.area_id == area_id).all()
     return schools
\ No newline at end of file
@@ -1,33 +1,62 @@
 from typing import List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import or_, func, case, select
 import pandas as pd
 import io
-
-from app.db.session import get_db
+import os
+import tempfile
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.pagination import MAX_PAGE_SIZE, paginate_async, keyset_order_by
+from app.db.session import get_db, read_session_factory
+from app.db.async_session import get_async_db, get_async_read_db
 from app.models.asset import Asset
 from app.models.location import School, Area
-from app.models.update_log import UpdateLog
-from app.models.user import User
-from app.schemas.asset import AssetResponse, AssetCreate, AssetUpdate, AssetPaginatedResponse
+from app.schemas.user import UserPrincipal
+from app.schemas.asset import (
+    AssetResponse, AssetCreate, AssetUpdate, AssetPaginatedResponse, AssetScanRequest, AssetScanResponse,
+    AssetBulkUpdate, AssetBulkUpdateResponse, AssetTimelineResponse
+)
+from app.schemas.import_job import ImportJobResponse
+from app.models.import_job import ImportJob
 from app.api.v1.endpoints.auth import get_current_user
+from app.services.asset_import import AssetImporter, ALLOW_DUPLICATE_IP_CATEGORIES, import_file
+from app.services.import_jobs import submit_import_job, rows_per_second
+from app.services.dashboard_stats import stat_key, record_changes, record_update
+from app.services.asset_bulk import BULK_FORBIDDEN_FIELDS, BULK_REQUIRED_FIELDS, bulk_update_assets
+from app.services.log_writer import write_log
+from app.services.asset_timeline import timeline_statements, merge_timeline
+from app.services.asset_scan import scan_lookup_query, match_scanned_codes
+from app.services.asset_export import EXPORT_MEDIA_TYPES, build_export_query, stream_csv, stream_xlsx
 
 router = APIRouter()
 
-ALLOW_DUPLICATE_IP_CATEGORIES = [
-    'CCTV', 'CTV',
-    'Router', 'RTR',
-    'Switch', 'SWI',
-    'Access Point', 'ACC',
-    'FingerPrint', 'FIP'
-]
+SPOOL_BUFFER_SIZE = 1024 * 1024
+
+def load_school(db: Session, school_id: int) -> Optional[School]:
+    return db.query(School).options(joinedload(School.area)).filter(School.id == school_id).first()
 
-def get_location_info(db: Session, school_id: int):
-    school = db.query(School).options(joinedload(School.area)).filter(School.id == school_id).first()
-    if school:
-        return school.name, (school.area.name if school.area else "Unknown Area")
-    return "Unknown School", "Unknown Area"
+def location_names(school: Optional[School]) -> tuple:
+    if not school:
+        return "Unknown School", "Unknown Area"
+    return school.name, (school.area.name if school.area else "Unknown Area")
+
+async def spool_upload(file: UploadFile) -> str:
+    """
+    Menyalin upload ke file sementara di disk per blok 1MB, tanpa memuat seluruh isi ke memori.
+    """
+    os.makedirs(settings.IMPORT_SPOOL_DIR, exist_ok=True)
+    suffix = os.path.splitext(file.filename)[1].lower()
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=settings.IMPORT_SPOOL_DIR)
+    with os.fdopen(fd, "wb") as spool:
+        while chunk := await file.read(SPOOL_BUFFER_SIZE):
+            spool.write(chunk)
+    return path
 
 def validate_ip_mac(db: Session, asset_in: AssetCreate | AssetUpdate, current_id: int = None):
     if asset_in.mac_address:
@@ -50,79 +79,201 @@ def validate_ip_mac(db: Session, asset_in: AssetCreate | AssetUpdate, current_id
                 )
             
 @router.get("/barcode/{barcode}", response_model=AssetResponse)
-def read_asset_by_barcode(barcode: str, db: Session = Depends(get_db)):
-    asset = db.query(Asset).filter(Asset.barcode == barcode).first()
+async def read_asset_by_barcode(barcode: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(Asset)
+        .options(joinedload(Asset.school).joinedload(School.area))
+        .where(Asset.barcode == barcode)
+    )
+    asset = result.scalars().first()
     if not asset:
         raise HTTPException(status_code=404, detail="Aset dengan barcode tersebut tidak ditemukan")
     return asset
 
-@router.get("/", response_model=AssetPaginatedResponse)
-def read_assets(
+@router.post("/scan", response_model=AssetScanResponse)
+async def scan_assets(scan_in: AssetScanRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Scan banyak barcode / serial number sekaligus untuk stock-take.
+    Semua kode di-resolve dalam satu query ber-index (barcode atau serial_number) beserta
+    nama sekolah & area. Bila `school_id` diisi, aset milik sekolah lain masuk `misplaced`.
+    """
+    if scan_in.school_id and not (await db.execute(select(School.id).where(School.id == scan_in.school_id))).first():
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+
+    rows = (await db.execute(scan_lookup_query(scan_in.codes))).mappings().all()
+
+    result = {"found": [], "misplaced": [], "not_found": [], "duplicates": []}
+    seen = set()
+    for code, matched_by, matches in match_scanned_codes(scan_in.codes, rows):
+        if not matches:
+            result["not_found"].append(code)
+            continue
+
+        if all(row["id"] in seen for row in matches):
+            result["duplicates"].append(code)
+            continue
+
+        for row in matches:
+            if row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            item = dict(row, code=code, matched_by=matched_by)
+            if scan_in.school_id and row["school_id"] != scan_in.school_id:
+                result["misplaced"].append(item)
+            else:
+                result["found"].append(item)
+    return result
+
+ASSET_SORT_FIELDS = {
+    "barcode": Asset.barcode,
+    "brand": Asset.brand,
+    "model_series": Asset.model_series,
+    "serial_number": Asset.serial_number,
+    "status": Asset.status,
+    "created_at": Asset.created_at,
+    "updated_at": Asset.updated_at,
+    "ip_address": Asset.ip_address,
+    "mac_address": Asset.mac_address,
+    "username": Asset.username
+}
+
+def asset_conditions(
     school_id: Optional[int] = None,
-    page: int = 1,
-    size: int = 10,
     type_code: Optional[str] = None,
     category_code: Optional[str] = None,
-    search: Optional[str] = None,
-    sort_by: Optional[str] = "created_at",
-    sort_order: Optional[str] = "desc",
-    db: Session = Depends(get_db)
-):
-    query = db.query(Asset)
-
+    search: Optional[str] = None
+) -> list:
+    """
+    Kondisi filter daftar aset, dipakai bersama oleh list dan export.
+    """
+    conditions = []
     if school_id:
-        school = db.query(School).filter(School.id == school_id).first()
-        if not school:
-            raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
-        query = query.filter(Asset.school_id == school_id)
-    
+        conditions.append(Asset.school_id == school_id)
+
     if type_code:
-        query = query.filter(Asset.type_code == type_code)
-    
+        conditions.append(Asset.type_code == type_code)
+
     if category_code:
-        query = query.filter(Asset.category_code == category_code)
-    
+        conditions.append(Asset.category_code == category_code)
+
     if search:
         search_fmt = f"%{search}%"
-        query = query.filter(
-            (Asset.barcode.ilike(search_fmt)) | 
+        conditions.append(
+            (Asset.barcode.ilike(search_fmt)) |
             (Asset.serial_number.ilike(search_fmt)) |
             (Asset.brand.ilike(search_fmt)) |
             (Asset.model_series.ilike(search_fmt))
         )
+    return conditions
 
-    total = query.count()
-    sort_fields = {
-        "barcode": Asset.barcode,
-        "brand": Asset.brand,
-        "model_series": Asset.model_series,
-        "serial_number": Asset.serial_number,
-        "status": Asset.status,
-        "created_at": Asset.created_at,
-        "updated_at": Asset.updated_at,
-        "ip_address": Asset.ip_address,
-        "mac_address": Asset.mac_address,
-        "username": Asset.username
-    }
-    
-    db_sort_field = sort_fields.get(sort_by, Asset.created_at)
-    
-    if sort_order == "asc":
-        query = query.order_by(db_sort_field.asc())
-    else:
-        query = query.order_by(db_sort_field.desc())
+def asset_filters(
+    db: Session,
+    school_id: Optional[int] = None,
+    type_code: Optional[str] = None,
+    category_code: Optional[str] = None,
+    search: Optional[str] = None
+) -> list:
+    if school_id and not db.query(School.id).filter(School.id == school_id).first():
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+    return asset_conditions(school_id, type_code, category_code, search)
+
+def asset_search_rank(dialect_name: str, search: str):
+    """
+    Skor relevansi hasil pencarian. PostgreSQL memakai similarity() dari pg_trgm,
+    database lain (SQLite untuk test) memakai peringkat sederhana exact > prefix > contains.
+    """
+    if dialect_name == "postgresql":
+        return func.greatest(
+            func.similarity(Asset.barcode, search),
+            func.similarity(Asset.serial_number, search),
+            func.word_similarity(search, Asset.brand),
+            func.word_similarity(search, Asset.model_series)
+        )
 
-    skip = (page - 1) * size
-    assets = query.options(
-        joinedload(Asset.school).joinedload(School.area)
-    ).offset(skip).limit(size).all()
+    term = search.lower()
+    prefix = f"{search}%"
+    return case(
+        (or_(func.lower(Asset.barcode) == term, func.lower(Asset.serial_number) == term), 3),
+        (or_(
+            Asset.barcode.ilike(prefix), Asset.serial_number.ilike(prefix),
+            Asset.brand.ilike(prefix), Asset.model_series.ilike(prefix)
+        ), 2),
+        else_=1
+    )
 
-    return {
-        "items": assets,
-        "total": total,
-        "page": page,
-        "size": size
-    }
+def asset_order_by(sort_by: Optional[str], sort_order: Optional[str]) -> list:
+    db_sort_field = ASSET_SORT_FIELDS.get(sort_by, Asset.created_at)
+    return keyset_order_by(db_sort_field, Asset.id, sort_order != "asc")
+
+@router.get("/", response_model=AssetPaginatedResponse)
+async def read_assets(
+    school_id: Optional[int] = None,
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    type_code: Optional[str] = None,
+    category_code: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: Optional[str] = "created_at",
+    sort_order: Optional[str] = "desc",
+    cursor: Optional[str] = None,
+    total_mode: str = "exact",
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    if school_id and not (await db.execute(select(School.id).where(School.id == school_id))).first():
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+
+    stmt = (
+        select(Asset)
+        .where(*asset_conditions(school_id, type_code, category_code, search))
+        .options(joinedload(Asset.school).joinedload(School.area))
+    )
+
+    if sort_by == "relevance" and search:
+        return await paginate_async(
+            db, stmt, "relevance", asset_search_rank(db.bind.dialect.name, search), Asset.id,
+            sort_order, page, size, cursor=cursor, total_mode=total_mode
+        )
+
+    sort_key = sort_by if sort_by in ASSET_SORT_FIELDS else "created_at"
+    return await paginate_async(
+        db, stmt, sort_key, ASSET_SORT_FIELDS[sort_key], Asset.id,
+        sort_order, page, size, cursor=cursor, total_mode=total_mode
+    )
+
+@router.get("/export")
+def export_assets(
+    request: Request,
+    format: str = "xlsx",
+    school_id: Optional[int] = None,
+    type_code: Optional[str] = None,
+    category_code: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: Optional[str] = "created_at",
+    sort_order: Optional[str] = "desc",
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Export daftar aset (filter sama dengan GET /assets/) sebagai .xlsx atau .csv.
+    Data dibaca per batch dengan server-side cursor dan dikirim secara streaming.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="Format export harus xlsx atau csv")
+
+    stmt = build_export_query(
+        asset_filters(db, school_id, type_code, category_code, search),
+        asset_order_by(sort_by, sort_order),
+        include_password=current_user.role == "admin"
+    )
+    # Client yang baru menulis tetap membaca dari primary
+    session_factory = read_session_factory(request)
+    stream = stream_csv(stmt, session_factory) if format == "csv" else stream_xlsx(stmt, session_factory)
+    filename = f"assets_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 @router.get("/{asset_id}", response_model=AssetResponse)
 def read_asset_detail(asset_id: int, db: Session = Depends(get_db)):
@@ -131,11 +282,34 @@ def read_asset_detail(asset_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Aset tidak ditemukan")
     return asset
 
+@router.get("/{asset_id}/timeline", response_model=AssetTimelineResponse)
+async def read_asset_timeline(
+    asset_id: int,
+    size: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Riwayat satu aset: log perubahan dan tiket servis dalam satu urutan (terbaru dulu),
+    dengan keyset pagination lewat `cursor`.
+    """
+    if size < 1 or size > 100:
+        raise HTTPException(status_code=400, detail="size harus antara 1 dan 100")
+    asset = await db.get(Asset, asset_id)
+    if not asset:
+        raise HTTPException(status_code=404, detail="Aset tidak ditemukan")
+
+    logs, services = timeline_statements(asset, size, cursor, db.bind.dialect.name)
+    log_rows = (await db.execute(logs)).mappings().all()
+    service_rows = (await db.execute(services)).mappings().all()
+    items, next_cursor = merge_timeline(log_rows, service_rows, size)
+    return {"asset_id": asset.id, "barcode": asset.barcode, "items": items, "size": size, "next_cursor": next_cursor}
+
 @router.post("/", response_model=AssetResponse)
 def create_asset(
     asset_in: AssetCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Hanya Admin yang bisa membuat aset baru")
@@ -145,16 +319,21 @@ def create_asset(
         raise HTTPException(status_code=400, detail=f"Barcode {asset_in.barcode} sudah terdaftar!")
     validate_ip_mac(db, asset_in)
 
+    school = load_school(db, asset_in.school_id)
+    if not school:
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+
     new_asset = Asset(**asset_in.dict())
+    new_asset.school = school
 
     try:
         db.add(new_asset)
-        db.commit()
-        db.refresh(new_asset)
-        school_name, area_name = get_location_info(db, new_asset.school_id)
-        
+        record_changes(db, added=[stat_key(new_asset)])
+        school_name, area_name = location_names(school)
+
         actor_name = current_user.full_name if current_user.full_name else current_user.email
-        log = UpdateLog(
+        write_log(
+            db,
             asset_barcode=new_asset.barcode,
             asset_name=f"{new_asset.brand} - {new_asset.model_series}",
             action="CREATE",
@@ -163,10 +342,11 @@ def create_asset(
             school_name=school_name,
             area_name=area_name
         )
-        db.add(log)
+        db.flush()
+        response = AssetResponse.model_validate(new_asset)
         db.commit()
 
-        return new_asset
+        return response
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -176,28 +356,37 @@ def update_asset(
     asset_id: int,
     asset_in: AssetUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Hanya Admin yang bisa mengedit aset")
 
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.query(Asset).options(joinedload(Asset.school).joinedload(School.area))\
+        .filter(Asset.id == asset_id).first()
     if not asset:
         raise HTTPException(status_code=404, detail="Aset tidak ditemukan")
     validate_ip_mac(db, asset_in, current_id=asset_id)
 
+    old_key = stat_key(asset)
     update_data = asset_in.dict(exclude_unset=True)
+    new_school_id = update_data.pop("school_id", None)
+    if new_school_id and new_school_id != asset.school_id:
+        school = load_school(db, new_school_id)
+        if not school:
+            raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+        asset.school = school
+        asset.school_id = new_school_id
     for field, value in update_data.items():
         setattr(asset, field, value)
 
     try:
         db.add(asset)
-        db.commit()
-        db.refresh(asset)
-        school_name, area_name = get_location_info(db, asset.school_id)
-        
+        record_update(db, old_key, stat_key(asset))
+        school_name, area_name = location_names(asset.school)
+
         actor_name = current_user.full_name if current_user.full_name else current_user.email
-        log = UpdateLog(
+        write_log(
+            db,
             asset_barcode=asset.barcode,
             asset_name=f"{asset.brand} - {asset.model_series}",
             action="UPDATE",
@@ -206,32 +395,90 @@ def update_asset(
             school_name=school_name,
             area_name=area_name
         )
-        db.add(log)
+        db.flush()
+        response = AssetResponse.model_validate(asset)
         db.commit()
 
-        return asset
+        return response
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.patch("/bulk", response_model=AssetBulkUpdateResponse)
+def bulk_update(
+    bulk_in: AssetBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Mengubah banyak aset sekaligus (mis. status, room, placement, assigned_to) berdasarkan
+    daftar `asset_ids` atau `filters` (sama dengan filter GET /assets/), dengan satu UPDATE
+    dan satu baris log per aset.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Hanya Admin yang bisa mengedit aset")
+
+    changes = bulk_in.changes.dict(exclude_unset=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="Tidak ada perubahan yang dikirim")
+    forbidden = [field for field in BULK_FORBIDDEN_FIELDS if field in changes]
+    if forbidden:
+        raise HTTPException(status_code=400, detail=f"Kolom {', '.join(forbidden)} tidak bisa diubah massal")
+    empty = [field for field in BULK_REQUIRED_FIELDS if field in changes and changes[field] is None]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"Kolom {', '.join(empty)} tidak boleh kosong")
+    if changes.get("school_id") and not db.query(School.id).filter(School.id == changes["school_id"]).first():
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+
+    not_found = []
+    if bulk_in.asset_ids:
+        asset_ids = list(dict.fromkeys(bulk_in.asset_ids))
+        existing = {row.id for row in db.query(Asset.id).filter(Asset.id.in_(asset_ids))}
+        not_found = [asset_id for asset_id in asset_ids if asset_id not in existing]
+        conditions = [Asset.id.in_(existing)]
+        matched = len(existing)
+    elif bulk_in.filters and bulk_in.filters.dict(exclude_none=True):
+        conditions = asset_filters(db, **bulk_in.filters.dict())
+        matched = None
+    else:
+        raise HTTPException(status_code=400, detail="Isi asset_ids atau filters")
+
+    actor_name = current_user.full_name if current_user.full_name else current_user.email
+    try:
+        updated = bulk_update_assets(db, conditions, changes, actor_name) if matched != 0 else 0
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        "status": "success",
+        "message": f"{updated} aset berhasil diperbarui",
+        "matched": updated if matched is None else matched,
+        "updated": updated,
+        "not_found": not_found
+    }
+
 @router.delete("/{asset_id}", response_model=AssetResponse)
 def delete_asset(
     asset_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Hanya Admin yang bisa menghapus aset")
 
-    asset = db.query(Asset).options(joinedload(Asset.school)).filter(Asset.id == asset_id).first()
+    asset = db.query(Asset).options(joinedload(Asset.school).joinedload(School.area))\
+        .filter(Asset.id == asset_id).first()
     
     if not asset:
         raise HTTPException(status_code=404, detail="Aset tidak ditemukan")
     
-    school_name, area_name = get_location_info(db, asset.school_id)
+    school_name, area_name = location_names(asset.school)
     actor_name = current_user.full_name if current_user.full_name else current_user.email
     deleted_asset_response = AssetResponse.model_validate(asset)
-    log = UpdateLog(
+    write_log(
+        db,
         asset_barcode=asset.barcode,
         asset_name=f"{asset.brand} - {asset.model_series}",
         action="DELETE",
@@ -240,8 +487,8 @@ def delete_asset(
         school_name=school_name,
         area_name=area_name
     )
-    db.add(log)
 
+    record_changes(db, removed=[stat_key(asset)])
     db.delete(asset)
     db.commit()
 
@@ -251,7 +498,7 @@ def delete_asset(
 async def import_assets(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     if current_user.role != "admin":
          raise HTTPException(status_code=403, detail="Hanya Admin yang bisa Import")
@@ -265,71 +512,84 @@ async def import_assets(
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(status_code=413, detail="Ukuran file terlalu besar (Maksimal 5MB)")
 
+    actor_name = current_user.full_name if current_user.full_name else current_user.email
+
+    def run_import() -> dict:
+        df = pd.read_excel(io.BytesIO(contents), dtype=object)
+        importer = AssetImporter(db, actor_name)
+        importer.import_frame(df)
+        return importer.result()
+
     try:
-        df = pd.read_excel(io.BytesIO(contents))
-        df = df.where(pd.notnull(df), None)
-        success_count = 0
-        errors = []
-        actor_name = current_user.full_name if current_user.full_name else current_user.email
+        # Parsing Excel & insert berjalan sinkron: jangan blokir event loop worker
+        return await run_in_threadpool(run_import)
 
-        for index, row in df.iterrows():
-            try:
-                asset_data = AssetCreate(
-                    barcode=str(row.get('Barcode')),
-                    serial_number=str(row.get('Serial Number')),
-                    school_id=int(row.get('School ID')),
-                    city_code=str(row.get('City Code')),
-                    type_code=str(row.get('Type Code')),
-                    category_code=row.get('Category Code'),
-                    subcategory_code=row.get('Subcategory Code'),
-                    procurement_month=str(row.get('Month')).zfill(2),
-                    procurement_year=str(row.get('Year')),
-                    floor=str(row.get('Floor')).zfill(2),
-                    sequence_number=str(row.get('Sequence')).zfill(3),
-                    brand=row.get('Brand'),
-                    model_series=row.get('Model'),
-                    room=row.get('Room'),
-                    placement=row.get('Placement'),
-                    ip_address=row.get('IP Address'),
-                    mac_address=row.get('MAC Address'),
-                    ram=row.get('RAM'),
-                    processor=row.get('Processor'),
-                    storage=row.get('Storage'),
-                    os=row.get('OS'),
-                    username=row.get('Username'),
-                    password=row.get('Password'),
-                    assigned_to=row.get('Assigned To'),
-                    status=row.get('Status') or "Berfungsi"
-                )
-                
-                validate_ip_mac(db, asset_data)
-                
-                new_asset = Asset(**asset_data.dict())
-                db.add(new_asset)
-                db.flush()
-                school_name, area_name = get_location_info(db, new_asset.school_id)
-                log = UpdateLog(
-                    asset_barcode=new_asset.barcode,
-                    asset_name=f"{new_asset.brand or ''} - {new_asset.model_series or ''}",
-                    action="IMPORT",
-                    details="Bulk Import via Excel",
-                    actor=actor_name,
-                    school_name=school_name,
-                    area_name=area_name
-                )
-                db.add(log)
-                db.commit()
-                success_count += 1
-                
-            except Exception as e:
-                db.rollback()
-                errors.append(f"Baris {index+2}: {str(e)}")
-        
-        return {
-            "message": "Proses Import Selesai",
-            "success_count": success_count,
-            "errors": errors
-        }
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Gagal memproses file: {str(e)}")
 
+
+@router.post("/import/stream", response_model=dict)
+async def import_assets_stream(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Import file besar (.xlsx/.csv) tanpa batas ukuran: file disimpan ke disk,
+    dibaca per chunk dan setiap chunk di-commit, sehingga memori tetap konstan.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Hanya Admin yang bisa Import")
+
+    if not file.filename.lower().endswith(('.xlsx', '.csv')):
+        raise HTTPException(status_code=400, detail="File harus berformat .xlsx atau .csv")
+
+    path = await spool_upload(file)
+    try:
+        actor_name = current_user.full_name if current_user.full_name else current_user.email
+        importer = AssetImporter(db, actor_name)
+        return await run_in_threadpool(import_file, importer, path, file.filename, settings.IMPORT_CHUNK_SIZE)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Gagal memproses file: {str(e)}")
\ No newline at end of file
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Gagal memproses file: {str(e)}")
+    finally:
+        os.remove(path)
+
+
+def import_job_response(job: ImportJob) -> ImportJobResponse:
+    response = ImportJobResponse.model_validate(job)
+    response.rows_per_second = rows_per_second(job)
+    return response
+
+@router.post("/import/jobs", response_model=ImportJobResponse, status_code=202)
+async def create_import_job(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Menjadwalkan import di background dan langsung mengembalikan ID job.
+    Progress bisa dipantau lewat GET /assets/import/jobs/{job_id}.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Hanya Admin yang bisa Import")
+
+    if not file.filename.lower().endswith(('.xlsx', '.csv')):
+        raise HTTPException(status_code=400, detail="File harus berformat .xlsx atau .csv")
+
+    path = await spool_upload(file)
+    actor_name = current_user.full_name if current_user.full_name else current_user.email
+    job = await run_in_threadpool(submit_import_job, db, file.filename, path, actor_name)
+    return import_job_response(job)
+
+@router.get("/import/jobs/{job_id}", response_model=ImportJobResponse)
+def read_import_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job import tidak ditemukan")
+    return import_job_response(job)
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.db.session import get_db
+from app.models.audit import AuditSession
+from app.models.location import School
+from app.schemas.user import UserPrincipal
+from app.schemas.audit import (
+    AuditSessionCreate, AuditSessionResponse, AuditScanRequest, AuditScanResponse, AuditDiffResponse
+)
+from app.api.v1.endpoints.auth import get_current_user
+from app.services.audit import open_session, record_scans, session_diff
+
+router = APIRouter()
+
+def get_audit_session(db: Session, session_id: int, for_update: bool = False) -> AuditSession:
+    query = db.query(AuditSession).filter(AuditSession.id == session_id)
+    if for_update:
+        query = query.with_for_update()
+    session = query.first()
+    if not session:
+        raise HTTPException(status_code=404, detail="Sesi audit tidak ditemukan")
+    return session
+
+@router.post("/", response_model=AuditSessionResponse)
+def create_audit_session(
+    session_in: AuditSessionCreate,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Membuka sesi stock-take untuk satu sekolah (opsional lantai / ruang).
+    Daftar aset yang diharapkan disalin saat sesi dibuka.
+    """
+    if not db.query(School.id).filter(School.id == session_in.school_id).first():
+        raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
+
+    actor_name = current_user.full_name if current_user.full_name else current_user.email
+    return open_session(db, session_in.school_id, session_in.floor, session_in.room, actor_name)
+
+@router.get("/{session_id}", response_model=AuditSessionResponse)
+def read_audit_session(
+    session_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    return get_audit_session(db, session_id)
+
+@router.post("/{session_id}/scans", response_model=AuditScanResponse)
+def scan_audit_items(
+    session_id: int,
+    scan_in: AuditScanRequest,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Mengirim satu batch hasil scan ke sesi audit. Selisih diperbarui secara incremental;
+    ringkasan terbaru dikembalikan bersama hasil per kode.
+    """
+    session = get_audit_session(db, session_id, for_update=True)
+    if session.status != "open":
+        raise HTTPException(status_code=400, detail="Sesi audit sudah ditutup")
+
+    results = record_scans(db, session, scan_in.codes)
+    return {"session": session, "results": results}
+
+@router.get("/{session_id}/diff", response_model=AuditDiffResponse)
+def read_audit_diff(
+    session_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    """
+    Daftar selisih sesi audit: missing (diharapkan tapi belum discan), wrong_location
+    (aset sekolah ini dari lantai/ruang lain), unexpected (aset sekolah lain), unknown (kode tidak terdaftar).
+    """
+    session = get_audit_session(db, session_id)
+    return {"session": session, **session_diff(db, session)}
+
+@router.post("/{session_id}/close", response_model=AuditSessionResponse)
+def close_audit_session(
+    session_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user)
+):
+    session = get_audit_session(db, session_id, for_update=True)
+    if session.status != "open":
+        raise HTTPException(status_code=400, detail="Sesi audit sudah ditutup")
+
+    session.status = "closed"
+    session.closed_at = datetime.now(timezone.utc)
+    db.commit()
+    db.refresh(session)
+    return session
@@ -8,19 +8,28 @@ from app.db.session import get_db
 from app.models.user import User
 from app.core.security import verify_password, create_access_token
 from app.schemas.token import Token
+from app.schemas.user import UserPrincipal
 from app.core.config import settings
+from app.core.cache import user_cache
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+def invalidate_user(user_id: int):
+    """
+    Dipanggil setelah data user berubah (profil, avatar, role) agar cache tidak basi.
+    """
+    user_cache.invalidate(int(user_id))
+
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-) -> User:
+) -> UserPrincipal:
     """
     Fungsi ini memvalidasi token dan mengambil data user aktif.
     Dipakai oleh endpoint lain (seperti Profile Page).
+    Data user diambil dari cache (LRU + TTL) sehingga tidak ada query per request.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,10 +41,15 @@ def get_current_user(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        user_id = int(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
-    
-    user = db.query(User).filter(User.id == user_id).first()
+
+    def load():
+        user = db.query(User).filter(User.id == user_id).first()
+        return UserPrincipal.model_validate(user) if user else None
+
+    user = user_cache.get_or_load(user_id, load)
     if user is None:
         raise credentials_exception
         
@@ -1,27 +1,104 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.async_session import get_async_read_db
+from app.core.pagination import MAX_PAGE_SIZE, paginate_async
 from app.models.update_log import UpdateLog
-from app.schemas.update_log import LogResponse, LogPaginatedResponse
+from app.schemas.update_log import LogPaginatedResponse
 
 router = APIRouter()
 
+# Kolom yang dihitung pada mode facets, beserta jumlah nilai teratas yang dikembalikan
+FACET_COLUMNS = {
+    "action": UpdateLog.action,
+    "actor": UpdateLog.actor,
+}
+FACET_LIMIT = 50
+
+def _utc_midnight(day: date) -> datetime:
+    # created_at bertipe timestamptz: batas tanggal dihitung sebagai pukul 00:00 UTC
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+def log_conditions(
+    search: Optional[str] = None,
+    action: Optional[str] = None,
+    actor: Optional[str] = None,
+    school_name: Optional[str] = None,
+    area_name: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> list:
+    """
+    Filter log. Kolom terstruktur dicocokkan persis agar memakai index (kolom, created_at, id);
+    `date_from` / `date_to` (inklusif) membatasi created_at sehingga PostgreSQL hanya membaca
+    partisi bulan yang relevan.
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from tidak boleh setelah date_to")
+
+    conditions = []
+    if date_from:
+        conditions.append(UpdateLog.created_at >= _utc_midnight(date_from))
+    if date_to:
+        conditions.append(UpdateLog.created_at < _utc_midnight(date_to + timedelta(days=1)))
+
+    for column, value in (
+        (UpdateLog.action, action),
+        (UpdateLog.actor, actor),
+        (UpdateLog.school_name, school_name),
+        (UpdateLog.area_name, area_name),
+    ):
+        if value:
+            conditions.append(column == value)
+
+    if search:
+        conditions.append(UpdateLog.asset_barcode.ilike(f"%{search}%"))
+    return conditions
+
+async def log_facets(db: AsyncSession, conditions: list) -> dict:
+    """
+    Jumlah log per action dan per actor untuk filter yang sama, dalam satu query (UNION ALL).
+    """
+    stmt = union_all(*(
+        select(literal(name).label("facet"), column.label("value"), func.count().label("count"))
+        .where(*conditions)
+        .group_by(column)
+        for name, column in FACET_COLUMNS.items()
+    ))
+    facets = {name: [] for name in FACET_COLUMNS}
+    for row in (await db.execute(stmt)).all():
+        facets[row.facet].append({"value": row.value, "count": row.count})
+    for name, values in facets.items():
+        values.sort(key=lambda item: (-item["count"], item["value"] or ""))
+        facets[name] = values[:FACET_LIMIT]
+    return facets
+
 @router.get("/", response_model=LogPaginatedResponse)
-def read_logs(
-    page: int = 1,
-    size: int = 10,
+async def read_logs(
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
     search: Optional[str] = None,
+    action: Optional[str] = None,
+    actor: Optional[str] = None,
+    school_name: Optional[str] = None,
+    area_name: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     sort_by: Optional[str] = "created_at",
     sort_order: Optional[str] = "desc",
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = "exact",
+    facets: bool = False,
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    query = db.query(UpdateLog)
-    
-    if search:
-        query = query.filter(UpdateLog.asset_barcode.ilike(f"%{search}%"))
-    
-    total = query.count()
+    """
+    Daftar log dengan filter action, actor, school_name, area_name dan rentang tanggal.
+    `facets=true` menambahkan jumlah log per action dan per actor untuk filter yang sama.
+    """
+    conditions = log_conditions(search, action, actor, school_name, area_name, date_from, date_to)
+    query = select(UpdateLog).where(*conditions)
 
     sort_fields = {
         "created_at": UpdateLog.created_at,
@@ -29,20 +106,12 @@ def read_logs(
         "action": UpdateLog.action,
         "actor": UpdateLog.actor
     }
-    
-    db_sort_field = sort_fields.get(sort_by, UpdateLog.created_at)
-
-    if sort_order == "asc":
-        query = query.order_by(db_sort_field.asc())
-    else:
-        query = query.order_by(db_sort_field.desc())
-        
-    skip = (page - 1) * size
-    logs = query.offset(skip).limit(size).all()
-    
-    return {
-        "items": logs,
-        "total": total,
-        "page": page,
-        "size": size
-    }
\ No newline at end of file
+
+    sort_key = sort_by if sort_by in sort_fields else "created_at"
+    result = await paginate_async(
+        db, query, sort_key, sort_fields[sort_key], UpdateLog.id,
+        sort_order, page, size, cursor=cursor, total_mode=total_mode
+    )
+    if facets:
+        result["facets"] = await log_facets(db, conditions)
+    return result
@@ -2,6 +2,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.cache import master_options_cache
+from app.core.http_cache import http_cache, bump_version
 from app.models.master import MasterOption
 from app.schemas.master import MasterOptionCreate, MasterOptionUpdate, MasterOptionResponse
 from app.api.deps import get_current_admin, get_current_active_user
@@ -12,16 +14,19 @@ router = APIRouter()
 def read_master_options(
     category: Optional[str] = None,
     parent_code: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_active_user)
+    current_user = Depends(get_current_active_user),
+    versions: tuple = Depends(http_cache("master_options", session=get_db, auth=get_current_active_user)),
+    db: Session = Depends(get_db)
 ):
-    query = db.query(MasterOption)
-    if category:
-        query = query.filter(MasterOption.category == category)
-    if parent_code:
-        query = query.filter(MasterOption.parent_code == parent_code)
-    
-    return query.all()
+    def load():
+        query = db.query(MasterOption)
+        if category:
+            query = query.filter(MasterOption.category == category)
+        if parent_code:
+            query = query.filter(MasterOption.parent_code == parent_code)
+        return [MasterOptionResponse.model_validate(option) for option in query.all()]
+
+    return master_options_cache.get_or_load((category, parent_code, versions), load)
 
 @router.post("/", response_model=MasterOptionResponse)
 def create_master_option(
@@ -44,8 +49,10 @@ def create_master_option(
         parent_code=option_in.parent_code
     )
     db.add(new_option)
+    bump_version(db, "master_options")
     db.commit()
     db.refresh(new_option)
+    master_options_cache.invalidate()
     return new_option
 
 @router.delete("/{option_id}")
@@ -59,5 +66,7 @@ def delete_master_option(
         raise HTTPException(status_code=404, detail="Data tidak ditemukan")
     
     db.delete(option)
+    bump_version(db, "master_options")
     db.commit()
+    master_options_cache.invalidate()
     return {"status": "success", "message": "Opsi berhasil dihapus"}
\ No newline at end of file
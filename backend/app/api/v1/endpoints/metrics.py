@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from app.api.deps import get_current_admin
+from app.core.cache import cache_stats
+from app.db.pool import pool_stats
+
+router = APIRouter()
+
+@router.get("/cache")
+def read_cache_metrics(current_user = Depends(get_current_admin)):
+    """
+    Statistik cache in-process (ukuran, hit, miss) untuk worker yang melayani request ini.
+    """
+    return cache_stats()
+
+
+@router.get("/pool")
+def read_pool_metrics(current_user = Depends(get_current_admin)):
+    """
+    Statistik pool koneksi database per engine: checkout, lama menunggu koneksi,
+    pemakaian overflow dan timeout sejak worker ini berjalan.
+    """
+    return pool_stats()
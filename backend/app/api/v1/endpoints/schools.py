@@ -1,17 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy.orm import Session, joinedload
+from app.db.session import get_read_db
+from app.core.cache import locations_cache
+from app.core.http_cache import http_cache
 from app.models.location import School
 from app.schemas.location import School as SchoolSchema
 
 router = APIRouter()
 
 @router.get("/{school_id}", response_model=SchoolSchema)
-def read_school(school_id: int, db: Session = Depends(get_db)):
+def read_school(
+    school_id: int,
+    versions: tuple = Depends(http_cache("schools", "areas")),
+    db: Session = Depends(get_read_db)
+):
     """
     Mengambil detail satu sekolah (Nama, Area ID, dll)
     """
-    school = db.query(School).filter(School.id == school_id).first()
+    def load():
+        school = db.query(School).options(joinedload(School.area)).filter(School.id == school_id).first()
+        return SchoolSchema.model_validate(school) if school else None
+
+    school = locations_cache.get_or_load(("school", school_id, versions), load)
     if not school:
         raise HTTPException(status_code=404, detail="Sekolah tidak ditemukan")
     return school
\ No newline at end of file
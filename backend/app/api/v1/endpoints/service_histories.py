@@ -1,63 +1,63 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.db.async_session import get_async_read_db
+from app.core.pagination import MAX_PAGE_SIZE, paginate_async
 from app.models.service_history import ServiceHistory
-from app.models.update_log import UpdateLog
-from app.models.asset import Asset
-from app.models.location import School, Area
-from app.models.user import User
+from app.schemas.user import UserPrincipal
 from app.schemas.service_history import ServiceCreate, ServiceResponse, ServicePaginatedResponse
 from app.api.v1.endpoints.auth import get_current_user
+from app.services.asset_identifiers import resolve_asset_identifier
+from app.services.log_writer import write_log
 
 router = APIRouter()
 
 def create_service_log(db: Session, service_obj: ServiceHistory, action_type: str, details: str, actor: str = "Admin"):
-    school_name = "Unknown School"
-    area_name = "Unknown Area"
-    
-    asset = db.query(Asset).options(joinedload(Asset.school).joinedload(School.area))\
-        .filter(Asset.barcode == service_obj.sn_or_barcode).first()
-    
-    if not asset:
-        asset = db.query(Asset).options(joinedload(Asset.school).joinedload(School.area))\
-            .filter(Asset.serial_number == service_obj.sn_or_barcode).first()
-
-    if asset and asset.school:
-        school_name = asset.school.name
-        if asset.school.area:
-            area_name = asset.school.area.name
-
-    log = UpdateLog(
+    """
+    Menautkan service ke asetnya (asset_id) dan menambahkan UpdateLog dengan lokasi aset.
+    asset_id dibaca di transaksi yang sama, nama sekolah/area dari cache.
+    """
+    location = resolve_asset_identifier(db, service_obj.sn_or_barcode)
+    asset_id, school_name, area_name = location if location else (None, None, None)
+    service_obj.asset_id = asset_id
+
+    write_log(
+        db,
         asset_barcode=service_obj.sn_or_barcode,
         asset_name=service_obj.asset_name or "Service Item",
         action=action_type,
         details=details,
         actor=actor,
-        school_name=school_name,
-        area_name=area_name
+        school_name=school_name or "Unknown School",
+        area_name=area_name or "Unknown Area"
     )
-    db.add(log)
 
 @router.get("/", response_model=ServicePaginatedResponse)
-def read_services(
-    page: int = 1,
-    size: int = 10,
+async def read_services(
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
     search: Optional[str] = None,
+    asset_id: Optional[int] = None,
     sort_by: Optional[str] = "service_date",
     sort_order: Optional[str] = "desc",
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = "exact",
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    query = db.query(ServiceHistory)
+    query = select(ServiceHistory)
+
+    if asset_id:
+        query = query.where(ServiceHistory.asset_id == asset_id)
     
     if search:
         search_fmt = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (ServiceHistory.sn_or_barcode.ilike(search_fmt)) | 
             (ServiceHistory.ticket_no.ilike(search_fmt))
         )
-        
-    total = query.count()
 
     sort_fields = {
         "ticket_no": ServiceHistory.ticket_no,
@@ -66,34 +66,21 @@ def read_services(
         "status": ServiceHistory.status,
         "vendor": ServiceHistory.vendor
     }
-    
-    db_sort_field = sort_fields.get(sort_by, ServiceHistory.service_date)
-    
-    if sort_order == "asc":
-        query = query.order_by(db_sort_field.asc())
-    else:
-        query = query.order_by(db_sort_field.desc())
 
-    skip = (page - 1) * size
-    services = query.offset(skip).limit(size).all()
-    
-    return {
-        "items": services,
-        "total": total,
-        "page": page,
-        "size": size
-    }
+    sort_key = sort_by if sort_by in sort_fields else "service_date"
+    return await paginate_async(
+        db, query, sort_key, sort_fields[sort_key], ServiceHistory.id,
+        sort_order, page, size, cursor=cursor, total_mode=total_mode
+    )
 
 @router.post("/", response_model=ServiceResponse)
 def create_service(
     service_in: ServiceCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     new_service = ServiceHistory(**service_in.dict())
     db.add(new_service)
-    db.commit()
-    db.refresh(new_service)
 
     actor_name = current_user.full_name if current_user.full_name else current_user.email
 
@@ -104,16 +91,18 @@ def create_service(
         f"Mencatat service baru: {new_service.issue_description}",
         actor=actor_name
     )
+    db.flush()
+    response = ServiceResponse.model_validate(new_service, from_attributes=True)
     db.commit()
 
-    return new_service
+    return response
 
 @router.put("/{service_id}", response_model=ServiceResponse)
 def update_service(
     service_id: int,
     service_in: ServiceCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     service = db.query(ServiceHistory).filter(ServiceHistory.id == service_id).first()
     if not service:
@@ -126,13 +115,13 @@ def update_service(
         setattr(service, field, value)
 
     db.add(service)
-    db.commit()
-    db.refresh(service)
 
     actor_name = current_user.full_name if current_user.full_name else current_user.email
 
     details = f"Update data service. Status: {old_status} -> {service.status}"
     create_service_log(db, service, "SERVICE UPDATE", details, actor=actor_name)
+    db.flush()
+    response = ServiceResponse.model_validate(service, from_attributes=True)
     db.commit()
 
-    return service
\ No newline at end of file
+    return response
\ No newline at end of file
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.db.session import get_db
-from app.models.asset import Asset
+from app.core.cache import locations_cache
+from app.core.http_cache import bump_version
 from app.models.location import School, Area
-from app.models.update_log import UpdateLog
 from app.schemas.transfer import MassTransferCreate, PartialTransferCreate
+from app.services.asset_transfer import transfer_assets
+from app.services.asset_identifiers import invalidate_school_locations
+from app.services.log_writer import write_log
 
 router = APIRouter()
 
@@ -30,7 +33,8 @@ def mass_transfer_school(
     school.area_id = transfer_in.new_area_id
     db.add(school)
     
-    log = UpdateLog(
+    write_log(
+        db,
         asset_barcode=f"SCHOOL-{school.id}", 
         asset_name=f"Sekolah: {school.name}",
         action="MASS TRANSFER",
@@ -39,9 +43,11 @@ def mass_transfer_school(
         school_name=school.name,
         area_name=new_area.name
     )
-    db.add(log)
+    bump_version(db, "schools")
 
     db.commit()
+    locations_cache.invalidate()
+    invalidate_school_locations([school.id])
     return {"status": "success", "message": f"Sekolah {school.name} berhasil dipindahkan ke {new_area.name}"}
 
 @router.post("/partial-assets")
@@ -49,43 +55,21 @@ def partial_transfer_assets(
     transfer_in: PartialTransferCreate,
     db: Session = Depends(get_db)
 ):
-    target_school = db.query(School).filter(School.id == transfer_in.target_school_id).first()
+    target_school = db.query(School).options(joinedload(School.area))\
+        .filter(School.id == transfer_in.target_school_id).first()
     if not target_school:
         raise HTTPException(status_code=404, detail="Sekolah tujuan tidak ditemukan")
 
-    target_area_name = "Unknown Area"
-    if target_school.area_id:
-        area = db.query(Area).filter(Area.id == target_school.area_id).first()
-        if area:
-            target_area_name = area.name
-
-    moved_count = 0
-    
-    for asset_id in transfer_in.asset_ids:
-        asset = db.query(Asset).filter(Asset.id == asset_id).first()
-        if asset:
-            old_school_name = "Unknown"
-            old_school = db.query(School).filter(School.id == asset.school_id).first()
-            if old_school:
-                old_school_name = old_school.name
-
-            asset.school_id = target_school.id
-            asset.room = transfer_in.new_room
-            asset.floor = transfer_in.new_floor
-            
-            db.add(asset)
-
-            log = UpdateLog(
-                asset_barcode=asset.barcode,
-                asset_name=f"{asset.brand} - {asset.model_series}",
-                action="ASSET TRANSFER",
-                details=f"Dipindahkan dari {old_school_name} ke {target_school.name}",
-                actor="Admin",
-                school_name=target_school.name,
-                area_name=target_area_name
-            )
-            db.add(log)
-            moved_count += 1
-
+    results = transfer_assets(
+        db, target_school, transfer_in.asset_ids, transfer_in.new_room, transfer_in.new_floor
+    )
     db.commit()
-    return {"status": "success", "message": f"{moved_count} aset berhasil dipindahkan ke {target_school.name}"}
\ No newline at end of file
+
+    moved_count = sum(1 for result in results if result["status"] == "moved")
+    return {
+        "status": "success",
+        "message": f"{moved_count} aset berhasil dipindahkan ke {target_school.name}",
+        "moved_count": moved_count,
+        "not_found_count": len(results) - moved_count,
+        "results": results
+    }
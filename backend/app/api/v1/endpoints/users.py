@@ -4,8 +4,9 @@ import uuid
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.auth import get_current_user, invalidate_user
 from app.models.user import User
+from app.schemas.user import UserPrincipal
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -14,7 +15,7 @@ class UserUpdate(BaseModel):
     full_name: str
 
 @router.get("/me")
-def read_user_me(current_user: User = Depends(get_current_user)):
+def read_user_me(current_user: UserPrincipal = Depends(get_current_user)):
     return {
         "email": current_user.email,
         "full_name": current_user.full_name,
@@ -26,19 +27,21 @@ def read_user_me(current_user: User = Depends(get_current_user)):
 def update_user_me(
     user_in: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
-    current_user.full_name = user_in.full_name
-    db.add(current_user)
+    user = db.query(User).filter(User.id == current_user.id).first()
+    user.full_name = user_in.full_name
+    db.add(user)
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    db.refresh(user)
+    invalidate_user(user.id)
+    return user
 
 @router.post("/me/avatar")
 async def upload_avatar(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ):
     allowed_extensions = {".jpg", ".jpeg", ".png"}
     filename_ext = os.path.splitext(file.filename)[1].lower()
@@ -55,8 +58,10 @@ async def upload_avatar(
     with open(file_location, "wb+") as file_object:
         shutil.copyfileobj(file.file, file_object)
     
-    current_user.avatar = f"/{file_location}" 
-    db.add(current_user)
+    user = db.query(User).filter(User.id == current_user.id).first()
+    user.avatar = f"/{file_location}" 
+    db.add(user)
     db.commit()
+    invalidate_user(user.id)
     
-    return {"avatar": current_user.avatar}
\ No newline at end of file
+    return {"avatar": user.avatar}
\ No newline at end of file
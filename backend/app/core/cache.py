@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.core.config import settings
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Cache in-process sederhana (LRU dengan TTL) yang aman dipakai antar thread.
+    Setiap worker uvicorn punya salinan sendiri, jadi TTL membatasi data basi
+    ketika invalidasi terjadi di worker lain.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        CACHES[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Mengambil dari cache, atau memanggil `loader` dan menyimpan hasilnya.
+        Hasil None tidak disimpan (mis. data tidak ditemukan).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 3) if total else None
+            }
+
+
+CACHES: Dict[str, TTLCache] = {}
+
+# Data referensi yang hampir statis: opsi master, area dan sekolah
+master_options_cache = TTLCache("master_options", ttl=settings.REFERENCE_CACHE_TTL, maxsize=256)
+locations_cache = TTLCache("locations", ttl=settings.REFERENCE_CACHE_TTL, maxsize=2048)
+
+# school_id -> (sekolah, area) untuk log service
+school_locations_cache = TTLCache("school_locations", ttl=settings.REFERENCE_CACHE_TTL, maxsize=2048)
+
+# User yang sedang login, agar request terautentikasi tidak perlu query users setiap kali
+user_cache = TTLCache("users", ttl=settings.USER_CACHE_TTL, maxsize=settings.USER_CACHE_SIZE)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in CACHES.items()}
@@ -18,4 +18,34 @@ class Settings:
     
     UPLOAD_DIR: str = "uploads"
 
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+    READ_REPLICA_STICKY_SECONDS: float = float(os.getenv("READ_REPLICA_STICKY_SECONDS", 5))
+
+    REFERENCE_CACHE_TTL: int = int(os.getenv("REFERENCE_CACHE_TTL", 300))
+    USER_CACHE_TTL: int = int(os.getenv("USER_CACHE_TTL", 60))
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", 1024))
+
+    IMPORT_CHUNK_SIZE: int = int(os.getenv("IMPORT_CHUNK_SIZE", 2000))
+    IMPORT_WORKERS: int = int(os.getenv("IMPORT_WORKERS", 2))
+    # Job "running" tanpa heartbeat selama ini dianggap mati (workernya crash / dimatikan)
+    IMPORT_JOB_STALE_SECONDS: float = float(os.getenv("IMPORT_JOB_STALE_SECONDS", 300))
+    IMPORT_SPOOL_DIR: str = os.getenv("IMPORT_SPOOL_DIR", os.path.join(UPLOAD_DIR, "imports"))
+
+    LOG_PARTITION_MONTHS_AHEAD: int = int(os.getenv("LOG_PARTITION_MONTHS_AHEAD", 3))
+    LOG_RETENTION_MONTHS: int = int(os.getenv("LOG_RETENTION_MONTHS", 24))
+    LOG_ARCHIVE_DIR: str = os.getenv("LOG_ARCHIVE_DIR", os.path.join("archives", "update_logs"))
+
+    # "sync": log ikut transaksi request (atomik dengan datanya); "async": ditulis per batch
+    # oleh update_log_writer setelah commit (lebih cepat, log bisa hilang bila proses mati)
+    LOG_WRITER_MODE: str = os.getenv("LOG_WRITER_MODE", "sync").lower()
+    LOG_WRITER_BATCH_SIZE: int = int(os.getenv("LOG_WRITER_BATCH_SIZE", 500))
+    LOG_WRITER_FLUSH_SECONDS: float = float(os.getenv("LOG_WRITER_FLUSH_SECONDS", 1))
+    LOG_WRITER_SPOOL_DIR: str = os.getenv("LOG_WRITER_SPOOL_DIR", os.path.join("spool", "update_logs"))
+    LOG_WRITER_FSYNC: bool = os.getenv("LOG_WRITER_FSYNC", "false").lower() in ("1", "true", "yes")
+
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,104 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.session import get_read_db
+from app.db.upsert import dialect_insert
+from app.models.table_version import TableVersion
+
+
+def bump_version(db: Session, *tables: str):
+    """
+    Menaikkan versi tabel di transaksi yang sama dengan perubahan datanya,
+    sehingga ETag lama otomatis tidak berlaku setelah commit.
+    """
+    now = datetime.now(timezone.utc)
+    stmt = dialect_insert(db)(TableVersion)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.table_name],
+        set_={"version": TableVersion.version + 1, "updated_at": now}
+    )
+    db.execute(stmt, [{"table_name": table, "version": 1, "updated_at": now} for table in tables])
+
+
+def get_versions(db: Session, tables: Tuple[str, ...]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    rows = db.execute(
+        select(TableVersion.table_name, TableVersion.version, TableVersion.updated_at)
+        .where(TableVersion.table_name.in_(tables))
+    ).all()
+    return {name: (version, updated_at) for name, version, updated_at in rows}
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _public() -> None:
+    return None
+
+
+def http_cache(*tables: str, session=get_read_db, auth=_public):
+    """
+    Dependency untuk GET data referensi. Menghitung ETag dari versi tabel + URL,
+    lalu menjawab 304 bila If-None-Match / If-Modified-Since masih cocok,
+    sebelum endpoint menyentuh ORM sama sekali.
+
+    `session` harus dependency yang sama dengan endpoint-nya, sehingga versi dan isi
+    dibaca dari database yang sama (primary atau replica). Versi tabel dikembalikan
+    agar endpoint memakainya sebagai bagian key cache in-process: isi lama di worker
+    lain tidak pernah dikirim dengan ETag versi baru.
+
+    `auth` adalah dependency autentikasi endpoint yang dilindungi. Dependency ini dijalankan
+    lebih dulu, sehingga request tanpa login mendapat 401 sebelum ETag dicocokkan.
+    """
+    def check(
+        request: Request,
+        response: Response,
+        current_user=Depends(auth),
+        db: Session = Depends(session)
+    ) -> Tuple:
+        versions = get_versions(db, tables)
+        table_versions = tuple((table, versions.get(table, (0, None))[0]) for table in tables)
+        fingerprint = "|".join(
+            [str(request.url.path), str(request.url.query)] +
+            [f"{table}:{version}" for table, version in table_versions]
+        )
+        etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()[:20]}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        timestamps = [updated_at for _, updated_at in versions.values() if updated_at]
+        last_modified = None
+        if timestamps:
+            last_modified = max(
+                ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc) for ts in timestamps
+            )
+            headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match:
+            not_modified = _matches(if_none_match, etag)
+        else:
+            not_modified = bool(if_modified_since and last_modified and _not_modified_since(if_modified_since, last_modified))
+
+        if not_modified:
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return table_versions
+
+    return check
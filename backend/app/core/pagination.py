@@ -0,0 +1,194 @@
+import base64
+import json
+from datetime import date, datetime, timezone
+from typing import Any, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import DateTime, and_, or_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+TOTAL_MODES = ("exact", "estimate", "none")
+# Batas `size` endpoint list (dropdown frontend memakai size=1000)
+MAX_PAGE_SIZE = 1000
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%f"
+
+
+def comparable_column(column, dialect_name: str):
+    """
+    SQLite menyimpan DateTime sebagai teks dengan format campuran: CURRENT_TIMESTAMP tanpa
+    mikrodetik, nilai dari ORM dengan .ffffff. Perbandingan teks dengan nilai cursor jadi
+    meleset, sehingga di SQLite kolom datetime diurutkan dan dibandingkan lewat strftime
+    dengan satu format tetap (presisi milidetik). Dialek lain memakai kolom apa adanya.
+    """
+    if dialect_name == "sqlite" and isinstance(getattr(column, "type", None), DateTime):
+        return func.strftime(SQLITE_DATETIME_FORMAT, column)
+    return column
+
+
+def comparable_value(value: Any, dialect_name: str) -> Any:
+    """
+    Nilai cursor dalam format yang sama dengan comparable_column.
+    """
+    if dialect_name != "sqlite" or not isinstance(value, datetime):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{value:%Y-%m-%d %H:%M:%S}.{value.microsecond // 1000:03d}"
+
+
+def keyset_order_by(sort_column, id_column, descending: bool) -> list:
+    """
+    Urutan deterministik untuk keyset pagination: kolom sort lalu id sebagai tie-breaker.
+    NULL dianggap nilai terbesar (default PostgreSQL), sehingga satu index btree
+    (kolom, id) bisa dipakai untuk urutan asc maupun desc.
+    """
+    if descending:
+        return [sort_column.desc().nulls_first(), id_column.desc()]
+    return [sort_column.asc().nulls_last(), id_column.asc()]
+
+
+def encode_cursor(sort_key: str, descending: bool, value: Any, row_id: int) -> str:
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    payload = json.dumps([sort_key, descending, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, descending: bool, sort_column):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, desc, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if key != sort_key or desc != descending or not isinstance(row_id, int):
+            raise ValueError("cursor tidak cocok dengan urutan")
+        if value is not None:
+            python_type = sort_column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+        return value, row_id
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Cursor tidak valid untuk urutan ini")
+
+
+def keyset_condition(sort_column, id_column, descending: bool, value: Any, row_id: int):
+    """
+    Kondisi "sesudah baris (value, row_id)" sesuai urutan keyset_order_by.
+    """
+    if descending:
+        if value is None:
+            return or_(and_(sort_column.is_(None), id_column < row_id), sort_column.isnot(None))
+        return or_(sort_column < value, and_(sort_column == value, id_column < row_id))
+
+    if value is None:
+        return and_(sort_column.is_(None), id_column > row_id)
+    return or_(sort_column > value, and_(sort_column == value, id_column > row_id), sort_column.is_(None))
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) untuk statement apapun; parameter tetap di-bind oleh driver
+    (psycopg2 maupun asyncpg).
+    """
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(ExplainJSON, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _plan_rows(plan) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_statement(stmt: Select) -> Select:
+    return select(func.count()).select_from(stmt.order_by(None).subquery())
+
+
+def _page_statement(stmt, sort_key: str, sort_column, id_column, descending: bool,
+                    page: int, size: int, cursor: Optional[str], dialect_name: str):
+    """
+    Menambahkan ORDER BY, lalu kondisi keyset (bila ada cursor) atau OFFSET, dan LIMIT size+1.
+    """
+    order_column = comparable_column(sort_column, dialect_name)
+    stmt = stmt.order_by(*keyset_order_by(order_column, id_column, descending))
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_key, descending, sort_column)
+        value = comparable_value(value, dialect_name)
+        stmt = stmt.filter(keyset_condition(order_column, id_column, descending, value, row_id))
+    else:
+        stmt = stmt.offset((page - 1) * size)
+    return stmt.limit(size + 1)
+
+
+def _check_params(sort_key: str, sort_column, cursor: Optional[str], total_mode: str) -> bool:
+    if total_mode not in TOTAL_MODES:
+        raise HTTPException(status_code=400, detail="total_mode harus exact, estimate atau none")
+    cursorable = isinstance(sort_column, InstrumentedAttribute)
+    if cursor and not cursorable:
+        raise HTTPException(status_code=400, detail=f"Urutan '{sort_key}' tidak mendukung cursor")
+    return cursorable
+
+
+def _page_result(items: List, total: Optional[int], sort_key: str, sort_column, id_column,
+                 descending: bool, cursorable: bool, page: int, size: int) -> dict:
+    next_cursor = None
+    has_more = len(items) > size
+    items = items[:size]
+    if has_more and cursorable and items:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            sort_key, descending, getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": size,
+        "next_cursor": next_cursor
+    }
+
+
+async def paginate_async(
+    db: AsyncSession,
+    stmt: Select,
+    sort_key: str,
+    sort_column,
+    id_column,
+    sort_order: Optional[str],
+    page: int,
+    size: int,
+    cursor: Optional[str] = None,
+    total_mode: str = "exact",
+) -> dict:
+    """
+    Pagination untuk endpoint list (AsyncSession + select()). Tanpa `cursor` memakai OFFSET (page),
+    dengan `cursor` memakai keyset sehingga halaman ke-N sama cepatnya dengan halaman pertama.
+    `next_cursor` selalu dikembalikan bila masih ada halaman berikutnya, kecuali bila
+    urutannya berupa ekspresi (mis. skor relevansi) yang hanya mendukung OFFSET.
+    `total_mode=estimate` memakai perkiraan planner PostgreSQL (EXPLAIN) tanpa scan tabel.
+    """
+    cursorable = _check_params(sort_key, sort_column, cursor, total_mode)
+    descending = sort_order != "asc"
+
+    total: Optional[int] = None
+    if total_mode == "exact" or (total_mode == "estimate" and db.bind.dialect.name != "postgresql"):
+        total = (await db.execute(count_statement(stmt))).scalar_one()
+    elif total_mode == "estimate":
+        total = _plan_rows((await db.execute(ExplainJSON(stmt.order_by(None)))).scalar())
+
+    result = await db.execute(
+        _page_statement(stmt, sort_key, sort_column, id_column, descending, page, size, cursor, db.bind.dialect.name)
+    )
+    items = result.unique().scalars().all()
+    return _page_result(items, total, sort_key, sort_column, id_column, descending, cursorable, page, size)
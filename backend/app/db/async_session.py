@@ -0,0 +1,55 @@
+import os
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.db.session import SQLALCHEMY_DATABASE_URL, READ_DATABASE_URL, recently_written
+from app.db.pool import engine_options, instrument_engine
+
+# Driver async untuk DATABASE_URL yang sama: asyncpg (PostgreSQL) / aiosqlite (SQLite, test)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Database '{backend}' tidak punya driver async yang didukung")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(SQLALCHEMY_DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **engine_options(ASYNC_SQLALCHEMY_DATABASE_URL, "primary_async", is_async=True)
+)
+instrument_engine(async_engine.sync_engine, "primary_async")
+
+ASYNC_READ_DATABASE_URL = os.getenv("ASYNC_READ_DATABASE_URL") or (
+    to_async_url(READ_DATABASE_URL) if READ_DATABASE_URL else None
+)
+
+if ASYNC_READ_DATABASE_URL:
+    async_read_engine = create_async_engine(
+        ASYNC_READ_DATABASE_URL,
+        **engine_options(ASYNC_READ_DATABASE_URL, "replica_async", is_async=True)
+    )
+    instrument_engine(async_read_engine.sync_engine, "replica_async")
+else:
+    async_read_engine = async_engine
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db(request: Request):
+    factory = AsyncSessionLocal
+    if async_read_engine is not async_engine and not recently_written(request):
+        factory = AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
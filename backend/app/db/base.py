@@ -4,4 +4,8 @@ from app.models.user import User
 from app.models.asset import Asset
 from app.models.service_history import ServiceHistory
 from app.models.update_log import UpdateLog
-from app.models.master import MasterOption
\ No newline at end of file
+from app.models.master import MasterOption
+from app.models.import_job import ImportJob
+from app.models.asset_stat import AssetStat
+from app.models.table_version import TableVersion
+from app.models.audit import AuditSession, AuditItem
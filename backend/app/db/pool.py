@@ -0,0 +1,165 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+POOL_METRICS: Dict[str, "PoolMetrics"] = {}
+
+
+class PoolMetrics:
+    """
+    Counter pool koneksi satu engine: jumlah checkout, lama menunggu koneksi,
+    pemakaian overflow dan timeout. Diisi oleh pool event dan connect() dari pool hasil _timed_pool_class().
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self._lock = threading.Lock()
+        POOL_METRICS[name] = self
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self):
+        pool = self.pool
+        with self._lock:
+            self.checkouts += 1
+            if isinstance(pool, QueuePool):
+                overflow = max(pool.overflow(), 0)
+                if overflow:
+                    self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+                self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+
+    def stats(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            data = {
+                "pool": type(pool).__name__ if pool else None,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "wait_total_ms": round(self.wait_total_ms, 2),
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 2),
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return data
+
+
+def _timed_pool_class(base, metrics: PoolMetrics):
+    """
+    Subclass pool yang mengukur lama connect() (antri + buka koneksi baru + pre-ping).
+    Disimpan sebagai atribut kelas agar tetap berlaku setelah pool di-recreate (dispose).
+    """
+    def connect(self):
+        metrics.pool = self
+        started = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except PoolTimeout:
+            metrics.record_wait((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
+
+
+def engine_options(url: str, name: str, is_async: bool = False) -> dict:
+    """
+    Argumen create_engine()/create_async_engine() dari Settings: ukuran pool, overflow,
+    timeout, recycle, pre-ping dan statement_timeout (khusus PostgreSQL).
+    SQLite in-memory tetap memakai pool bawaan.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+    if backend == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    metrics = PoolMetrics(name)
+    options.update({
+        "poolclass": _timed_pool_class(AsyncAdaptedQueuePool if is_async else QueuePool, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    })
+
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def instrument_engine(engine: Engine, name: str):
+    """
+    Memasang pool event (connect, checkout, checkin, invalidate) ke engine.
+    Untuk AsyncEngine berikan `async_engine.sync_engine`.
+    """
+    metrics = POOL_METRICS.get(name) or PoolMetrics(name)
+    metrics.pool = engine.pool
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.increment("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.record_checkout()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.increment("invalidations")
+
+
+def pool_stats() -> dict:
+    return {name: metrics.stats() for name, metrics in POOL_METRICS.items()}
@@ -1,6 +1,12 @@
-from sqlalchemy import create_engine
+from typing import Optional
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.pool import engine_options, instrument_engine
+import math
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,13 +16,84 @@ SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 if not SQLALCHEMY_DATABASE_URL:
     raise ValueError("DATABASE_URL tidak ditemukan di file .env")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Opsional: replica baca untuk list, dashboard dan laporan. Tanpa ini semua query ke primary.
+READ_DATABASE_URL = os.getenv("READ_DATABASE_URL")
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL, "primary"))
+instrument_engine(engine, "primary")
+
+if READ_DATABASE_URL:
+    read_engine = create_engine(READ_DATABASE_URL, **engine_options(READ_DATABASE_URL, "replica"))
+    instrument_engine(read_engine, "replica")
+else:
+    read_engine = engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Waktu commit terakhir milik client dikirim balik lewat cookie (dan header untuk client lintas origin)
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+@event.listens_for(SessionLocal, "after_flush")
+def _flag_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+@event.listens_for(SessionLocal, "after_commit")
+def _mark_request_write(session):
+    request = session.info.get("request")
+    if session.info.pop("has_writes", False) and request is not None:
+        request.state.last_write = time.time()
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _clear_write_flag(session, previous_transaction):
+    session.info.pop("has_writes", None)
+
+def recently_written(request: Optional[Request]) -> bool:
+    """
+    True bila client pengirim request ini baru saja meng-commit perubahan, sehingga
+    bacaannya tetap ke primary (read-your-writes) selama replica mengejar.
+    Client lain tetap membaca dari replica.
+    """
+    if request is None:
+        return False
+    value = request.cookies.get(LAST_WRITE_COOKIE) or request.headers.get(LAST_WRITE_HEADER)
+    try:
+        last_write = float(value)
+    except (TypeError, ValueError):
+        return False
+    return time.time() - last_write < settings.READ_REPLICA_STICKY_SECONDS
+
+def remember_write(request: Request, response: Response):
+    """
+    Dipanggil middleware: menandai client yang request-nya meng-commit perubahan.
+    """
+    last_write = getattr(request.state, "last_write", None)
+    if last_write is None:
+        return
+    value = f"{last_write:.3f}"
+    response.set_cookie(
+        LAST_WRITE_COOKIE, value,
+        max_age=max(1, math.ceil(settings.READ_REPLICA_STICKY_SECONDS)),
+        httponly=True, samesite="lax"
+    )
+    response.headers[LAST_WRITE_HEADER] = value
+
+def read_session_factory(request: Optional[Request] = None):
+    if read_engine is engine or recently_written(request):
+        return SessionLocal
+    return ReadSessionLocal
+
+def get_db(request: Request):
+    db = SessionLocal(info={"request": request})
+    try:
+        yield db
+    finally:
+        db.close()
 
-def get_db():
-    db = SessionLocal()
+def get_read_db(request: Request):
+    db = read_session_factory(request)()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,11 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session):
+    """
+    Konstruktor INSERT milik dialect aktif yang mendukung ON CONFLICT (PostgreSQL / SQLite).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
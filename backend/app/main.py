@@ -1,13 +1,32 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.api.v1.api import api_router
+from app.services.import_jobs import recover_import_jobs, shutdown_executor
+from app.services.log_partitions import ensure_log_partitions
+from app.services.log_writer import update_log_writer
+from app.db.session import LAST_WRITE_HEADER, remember_write
+from app.db.async_session import async_engine, async_read_engine
 import os
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    recover_import_jobs()
+    ensure_log_partitions()
+    update_log_writer.start()
+    yield
+    shutdown_executor()
+    update_log_writer.stop()
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
 app = FastAPI(
     title="IT Asset Management BPK PENABUR",
     description="API untuk manajemen aset IT BPK PENABUR",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 origins = [
@@ -21,8 +40,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[LAST_WRITE_HEADER],
 )
 
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    remember_write(request, response)
+    return response
+
 os.makedirs("uploads/avatars", exist_ok=True)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
@@ -1,11 +1,30 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.sql.sqltypes import DateTime
 from app.db.base_class import Base
 
+SEARCH_COLUMNS = ("barcode", "serial_number", "brand", "model_series")
+
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        # Index komposit untuk filter/sort yang paling sering dipakai daftar aset
+        Index("ix_assets_school_id_created_at", "school_id", "created_at", "id"),
+        Index("ix_assets_created_at", "created_at", "id"),
+        Index("ix_assets_type_code_category_code", "type_code", "category_code"),
+        Index("ix_assets_status", "status"),
+    ) + tuple(
+        # Index trigram (pg_trgm) agar pencarian ILIKE '%term%' tidak seq scan
+        Index(
+            f"ix_assets_{column}_trgm", column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"}
+        )
+        for column in SEARCH_COLUMNS
+    )
+    # created_at/updated_at diisi server; ambil lewat RETURNING saat flush agar tidak perlu SELECT ulang
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     barcode = Column(String, unique=True, index=True, nullable=False)
@@ -22,8 +41,8 @@ class Asset(Base):
     brand = Column(String, nullable=True)                   
     room = Column(String, nullable=True)                    
     model_series = Column(String, nullable=True)            
-    ip_address = Column(String, nullable=True) 
-    mac_address = Column(String, nullable=True)
+    ip_address = Column(String, nullable=True, index=True)
+    mac_address = Column(String, nullable=True, index=True)
     serial_number = Column(String, nullable=False, index=True)
     ram = Column(String, nullable=True)        
     processor = Column(String, nullable=True)  
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.db.base_class import Base
+
+class AssetStat(Base):
+    """
+    Ringkasan jumlah aset per (sekolah, tipe, status, bulan pengadaan) untuk Dashboard.
+    Diperbarui secara inkremental oleh setiap operasi tulis aset.
+    """
+    __tablename__ = "asset_stats"
+
+    school_id = Column(Integer, ForeignKey("schools.id"), primary_key=True)
+    type_code = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    procurement_month = Column(String, primary_key=True)
+    asset_count = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class AuditSession(Base):
+    __tablename__ = "audit_sessions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    school_id = Column(Integer, ForeignKey("schools.id"), nullable=False, index=True)
+    floor = Column(String, nullable=True)
+    room = Column(String, nullable=True)
+    status = Column(String, default="open", nullable=False)
+    opened_by = Column(String, nullable=True)
+    expected_count = Column(Integer, default=0, nullable=False)
+    matched_count = Column(Integer, default=0, nullable=False)
+    wrong_location_count = Column(Integer, default=0, nullable=False)
+    unexpected_count = Column(Integer, default=0, nullable=False)
+    unknown_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    closed_at = Column(DateTime(timezone=True), nullable=True)
+
+    school = relationship("School")
+
+    @property
+    def missing_count(self) -> int:
+        return self.expected_count - self.matched_count
+
+class AuditItem(Base):
+    """
+    Satu baris per aset yang diharapkan ada di lokasi audit (snapshot saat sesi dibuka)
+    atau per kode yang discan di luar daftar tersebut.
+    result: pending, matched, wrong_location, unexpected, unknown
+    """
+    __tablename__ = "audit_items"
+    __table_args__ = (
+        Index("ix_audit_items_session_id_asset_id", "session_id", "asset_id"),
+        Index("ix_audit_items_session_id_result", "session_id", "result"),
+        Index("ix_audit_items_session_id_code", "session_id", "code"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("audit_sessions.id", ondelete="CASCADE"), nullable=False)
+    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="SET NULL"), nullable=True)
+    barcode = Column(String, nullable=True)
+    code = Column(String, nullable=True)
+    expected = Column(Boolean, default=False, nullable=False)
+    result = Column(String, default="pending", nullable=False)
+    scanned_at = Column(DateTime(timezone=True), nullable=True)
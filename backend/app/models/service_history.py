@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, String, Date, Text, DateTime
+from sqlalchemy import Column, Integer, String, Date, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
 class ServiceHistory(Base):
     __tablename__ = "service_histories"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Timeline aset: cari per SN/barcode persis, urut service_date
+        Index("ix_service_histories_sn_or_barcode_service_date", "sn_or_barcode", "service_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -11,6 +17,7 @@ class ServiceHistory(Base):
     service_date = Column(Date, nullable=True)   
     asset_name = Column(String, nullable=True)   
     sn_or_barcode = Column(String, nullable=False, index=True) 
+    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="SET NULL"), nullable=True, index=True)
     unit_name = Column(String, nullable=True)    
     owner = Column(String, nullable=True)         
     production_year = Column(String, nullable=True)
@@ -18,4 +25,6 @@ class ServiceHistory(Base):
     vendor = Column(String, nullable=False) 
     status = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    asset = relationship("Asset")
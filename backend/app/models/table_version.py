@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from app.db.base_class import Base
+
+class TableVersion(Base):
+    """
+    Nomor versi per tabel referensi, dinaikkan setiap kali isinya berubah.
+    Dipakai untuk ETag / Last-Modified pada endpoint GET.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
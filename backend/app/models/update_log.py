@@ -1,9 +1,20 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
 class UpdateLog(Base):
+    # Di PostgreSQL tabel ini dipartisi per bulan pada created_at (primary key: id, created_at)
     __tablename__ = "update_logs"
+    __table_args__ = (
+        # Timeline aset: cari per barcode persis, urut created_at tanpa sort tambahan
+        Index("ix_update_logs_asset_barcode_created_at", "asset_barcode", "created_at", "id"),
+        # Filter log terstruktur: cari per nilai persis lalu urut created_at
+        Index("ix_update_logs_created_at", "created_at", "id"),
+        Index("ix_update_logs_action_created_at", "action", "created_at", "id"),
+        Index("ix_update_logs_actor_created_at", "actor", "created_at", "id"),
+        Index("ix_update_logs_school_name_created_at", "school_name", "created_at", "id"),
+        Index("ix_update_logs_area_name_created_at", "area_name", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     asset_barcode = Column(String, index=True)
@@ -1,8 +1,12 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Literal, Union
+from datetime import date, datetime
 import re
 
+IP_PATTERN = r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
+MAC_PATTERN = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
+SCAN_MAX_CODES = 1000
+
 class AreaSimple(BaseModel):
     id: int
     name: str
@@ -55,16 +59,14 @@ class AssetBase(BaseModel):
     @field_validator('ip_address')
     def validate_ip(cls, v):
         if v:
-            pattern = r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-            if not re.match(pattern, v):
+            if not re.match(IP_PATTERN, v):
                 raise ValueError('Format IP Address salah!')
         return v
 
     @field_validator('mac_address')
     def validate_mac(cls, v):
         if v:
-            pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-            if not re.match(pattern, v):
+            if not re.match(MAC_PATTERN, v):
                 raise ValueError('Format MAC Address salah!')
         return v
 
@@ -111,16 +113,14 @@ class AssetUpdate(BaseModel):
     @field_validator('ip_address')
     def validate_ip(cls, v):
         if v:
-            pattern = r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-            if not re.match(pattern, v):
+            if not re.match(IP_PATTERN, v):
                 raise ValueError('Format IP Address salah!')
         return v
 
     @field_validator('mac_address')
     def validate_mac(cls, v):
         if v:
-            pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-            if not re.match(pattern, v):
+            if not re.match(MAC_PATTERN, v):
                 raise ValueError('Format MAC Address salah!')
         return v
 
@@ -137,6 +137,81 @@ class AssetResponse(AssetBase):
 
 class AssetPaginatedResponse(BaseModel):
     items: List[AssetResponse]
-    total: int
+    total: Optional[int] = None
     page: int
-    size: int
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None
+
+class ScanCodes(BaseModel):
+    codes: List[str]
+
+    @field_validator('codes')
+    def clean_codes(cls, v):
+        codes = list(dict.fromkeys(code.strip() for code in v if code and code.strip()))
+        if not codes:
+            raise ValueError('Minimal satu barcode / serial number')
+        if len(codes) > SCAN_MAX_CODES:
+            raise ValueError(f'Maksimal {SCAN_MAX_CODES} kode per scan')
+        return codes
+
+class AssetScanRequest(ScanCodes):
+    school_id: Optional[int] = None
+
+class AssetScanItem(BaseModel):
+    code: str
+    matched_by: str
+    id: int
+    barcode: str
+    serial_number: str
+    brand: Optional[str] = None
+    model_series: Optional[str] = None
+    status: str
+    school_id: int
+    school_name: Optional[str] = None
+    area_name: Optional[str] = None
+    floor: Optional[str] = None
+    room: Optional[str] = None
+
+class AssetScanResponse(BaseModel):
+    found: List[AssetScanItem]
+    misplaced: List[AssetScanItem]
+    not_found: List[str]
+    duplicates: List[str]
+
+class AssetBulkFilter(BaseModel):
+    school_id: Optional[int] = None
+    type_code: Optional[str] = None
+    category_code: Optional[str] = None
+    search: Optional[str] = None
+
+class AssetBulkUpdate(BaseModel):
+    asset_ids: Optional[List[int]] = None
+    filters: Optional[AssetBulkFilter] = None
+    changes: AssetUpdate
+
+class AssetBulkUpdateResponse(BaseModel):
+    status: str
+    message: str
+    matched: int
+    updated: int
+    not_found: List[int] = []
+
+class AssetTimelineEntry(BaseModel):
+    kind: Literal["log", "service"]
+    id: int
+    timestamp: Union[datetime, date]
+    action: Optional[str] = None
+    details: Optional[str] = None
+    actor: Optional[str] = None
+    school_name: Optional[str] = None
+    area_name: Optional[str] = None
+    ticket_no: Optional[str] = None
+    vendor: Optional[str] = None
+    status: Optional[str] = None
+
+class AssetTimelineResponse(BaseModel):
+    asset_id: int
+    barcode: str
+    items: List[AssetTimelineEntry]
+    size: int
+    next_cursor: Optional[str] = None
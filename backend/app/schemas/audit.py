@@ -0,0 +1,60 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+from app.schemas.asset import ScanCodes
+
+class AuditSessionCreate(BaseModel):
+    school_id: int
+    floor: Optional[str] = None
+    room: Optional[str] = None
+
+class AuditSessionResponse(BaseModel):
+    id: int
+    school_id: int
+    floor: Optional[str] = None
+    room: Optional[str] = None
+    status: str
+    opened_by: Optional[str] = None
+    expected_count: int
+    matched_count: int
+    missing_count: int
+    wrong_location_count: int
+    unexpected_count: int
+    unknown_count: int
+    created_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class AuditScanRequest(ScanCodes):
+    pass
+
+class AuditScanResult(BaseModel):
+    code: str
+    result: str
+    asset_id: Optional[int] = None
+    barcode: Optional[str] = None
+
+class AuditScanResponse(BaseModel):
+    session: AuditSessionResponse
+    results: List[AuditScanResult]
+
+class AuditDiffItem(BaseModel):
+    asset_id: Optional[int] = None
+    barcode: Optional[str] = None
+    code: Optional[str] = None
+    brand: Optional[str] = None
+    model_series: Optional[str] = None
+    school_id: Optional[int] = None
+    school_name: Optional[str] = None
+    floor: Optional[str] = None
+    room: Optional[str] = None
+    scanned_at: Optional[datetime] = None
+
+class AuditDiffResponse(BaseModel):
+    session: AuditSessionResponse
+    missing: List[AuditDiffItem]
+    wrong_location: List[AuditDiffItem]
+    unexpected: List[AuditDiffItem]
+    unknown: List[AuditDiffItem]
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, field_validator
+from typing import Optional, List
+from datetime import datetime
+
+class ImportJobResponse(BaseModel):
+    id: int
+    filename: str
+    status: str
+    rows_processed: int
+    success_count: int
+    error_count: int
+    rows_per_second: Optional[float] = None
+    errors: List[str] = []
+    message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @field_validator('errors', mode='before')
+    def default_errors(cls, v):
+        return v or []
+
+    class Config:
+        from_attributes = True
@@ -19,6 +19,7 @@ class ServiceCreate(ServiceBase):
 
 class ServiceResponse(ServiceBase):
     id: int
+    asset_id: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -27,6 +28,7 @@ class Config:
 
 class ServicePaginatedResponse(BaseModel):
     items: List[ServiceResponse]
-    total: int
+    total: Optional[int] = None
     page: int
-    size: int
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None
\ No newline at end of file
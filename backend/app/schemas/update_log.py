@@ -16,8 +16,18 @@ class LogResponse(BaseModel):
 class Config:
         from_attributes = True
 
+class LogFacetCount(BaseModel):
+    value: Optional[str] = None
+    count: int
+
+class LogFacets(BaseModel):
+    action: List[LogFacetCount]
+    actor: List[LogFacetCount]
+
 class LogPaginatedResponse(BaseModel):
     items: List[LogResponse]
-    total: int
+    total: Optional[int] = None
     page: int
-    size: int
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None
+    facets: Optional[LogFacets] = None
\ No newline at end of file
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class UserPrincipal(BaseModel):
+    """
+    Data user yang sedang login (snapshot, bukan objek ORM) sehingga aman disimpan di cache.
+    """
+    id: int
+    email: str
+    full_name: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = True
+    avatar: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+        frozen = True
@@ -0,0 +1,62 @@
+from collections import Counter
+from typing import Dict
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.location import School, Area
+from app.models.update_log import UpdateLog
+from app.services.dashboard_stats import KEY_FIELDS, record_changes
+
+# Kolom identitas / unik tidak boleh diubah massal
+BULK_FORBIDDEN_FIELDS = ("barcode", "serial_number", "ip_address", "mac_address")
+# Kolom NOT NULL: nilai null eksplisit di perubahan massal ditolak sebelum UPDATE
+BULK_REQUIRED_FIELDS = tuple(column.name for column in Asset.__table__.columns if not column.nullable)
+
+
+def bulk_update_assets(db: Session, conditions: list, changes: Dict, actor: str) -> int:
+    """
+    Menerapkan perubahan yang sama ke semua aset yang memenuhi `conditions`:
+    - asset_stats disesuaikan dari satu GROUP BY (hanya bila kolom ringkasan berubah)
+    - satu baris UpdateLog per aset lewat INSERT ... SELECT
+    - satu UPDATE set-based
+    Mengembalikan jumlah aset yang diubah; commit dilakukan oleh pemanggil.
+    """
+    key_changes = {field: changes[field] for field in KEY_FIELDS if field in changes}
+    if key_changes:
+        key_columns = [getattr(Asset, field) for field in KEY_FIELDS]
+        groups = db.execute(
+            select(*key_columns, func.count(Asset.id)).where(*conditions).group_by(*key_columns)
+        ).all()
+        removed, added = Counter(), Counter()
+        for *key, count in groups:
+            removed[tuple(key)] += count
+            added[tuple(key_changes.get(field, value) for field, value in zip(KEY_FIELDS, key))] += count
+        record_changes(db, added=added, removed=removed)
+
+    # Nama sekolah/area di log mengikuti lokasi sesudah perubahan
+    school_id = changes.get("school_id") or Asset.school_id
+    school_name = select(School.name).where(School.id == school_id).scalar_subquery()
+    area_name = (
+        select(Area.name).join(School, School.area_id == Area.id).where(School.id == school_id).scalar_subquery()
+    )
+    details = "Memperbarui data aset (massal): " + ", ".join(sorted(changes))
+    db.execute(
+        insert(UpdateLog).from_select(
+            ["asset_barcode", "asset_name", "action", "details", "actor", "school_name", "area_name"],
+            select(
+                Asset.barcode,
+                func.coalesce(Asset.brand, "") + " - " + func.coalesce(Asset.model_series, ""),
+                literal("BULK UPDATE"),
+                literal(details),
+                literal(actor),
+                func.coalesce(school_name, "Unknown School"),
+                func.coalesce(area_name, "Unknown Area")
+            ).where(*conditions)
+        )
+    )
+
+    result = db.execute(
+        update(Asset).where(*conditions).values(**changes).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
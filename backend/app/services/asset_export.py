@@ -0,0 +1,133 @@
+import csv
+import io
+import os
+import tempfile
+from typing import Callable, Iterator, List
+from openpyxl import Workbook
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models.asset import Asset
+from app.models.location import School, Area
+
+EXPORT_BATCH_SIZE = 1000
+FILE_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Header mengikuti template import sehingga hasil export bisa di-import ulang.
+# Kolom "Password" hanya disertakan untuk admin (lihat build_export_query).
+EXPORT_COLUMNS = [
+    ("Barcode", Asset.barcode),
+    ("Serial Number", Asset.serial_number),
+    ("School ID", Asset.school_id),
+    ("School Name", School.name),
+    ("Area Name", Area.name),
+    ("City Code", Asset.city_code),
+    ("Type Code", Asset.type_code),
+    ("Category Code", Asset.category_code),
+    ("Subcategory Code", Asset.subcategory_code),
+    ("Month", Asset.procurement_month),
+    ("Year", Asset.procurement_year),
+    ("Floor", Asset.floor),
+    ("Sequence", Asset.sequence_number),
+    ("Brand", Asset.brand),
+    ("Model", Asset.model_series),
+    ("Room", Asset.room),
+    ("Placement", Asset.placement),
+    ("IP Address", Asset.ip_address),
+    ("MAC Address", Asset.mac_address),
+    ("RAM", Asset.ram),
+    ("Processor", Asset.processor),
+    ("GPU", Asset.gpu),
+    ("Storage", Asset.storage),
+    ("OS", Asset.os),
+    ("Username", Asset.username),
+    ("Password", Asset.password),
+    ("Assigned To", Asset.assigned_to),
+    ("Status", Asset.status),
+    ("Created At", Asset.created_at),
+]
+
+
+ADMIN_ONLY_EXPORT_HEADERS = {"Password"}
+
+
+def build_export_query(conditions: List, order_by: List, include_password: bool = False) -> Select:
+    """
+    Kolom diberi label sesuai header export; password aset hanya ikut bila include_password.
+    """
+    columns = [
+        column.label(header)
+        for header, column in EXPORT_COLUMNS
+        if include_password or header not in ADMIN_ONLY_EXPORT_HEADERS
+    ]
+    return (
+        select(*columns)
+        .select_from(Asset)
+        .outerjoin(School, Asset.school_id == School.id)
+        .outerjoin(Area, School.area_id == Area.id)
+        .where(*conditions)
+        .order_by(*order_by)
+    )
+
+
+def _headers(stmt: Select) -> List[str]:
+    return list(stmt.selected_columns.keys())
+
+
+def _iter_batches(stmt: Select, session_factory: Callable[[], Session]) -> Iterator[list]:
+    """
+    Membaca hasil query per batch dengan server-side cursor (yield_per),
+    memakai session sendiri (replica bila ada) karena generator berjalan setelah endpoint selesai.
+    """
+    db = session_factory()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for partition in result.partitions():
+            yield partition
+    finally:
+        db.close()
+
+
+def stream_csv(stmt: Select, session_factory: Callable[[], Session]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_headers(stmt))
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+    for rows in _iter_batches(stmt, session_factory):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_xlsx(stmt: Select, session_factory: Callable[[], Session]) -> Iterator[bytes]:
+    """
+    Workbook ditulis dalam mode write-only (baris langsung ke file sementara),
+    lalu file dikirim per potongan 64KB dan dihapus setelah selesai.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Assets")
+        sheet.append(_headers(stmt))
+        for rows in _iter_batches(stmt, session_factory):
+            for row in rows:
+                sheet.append([
+                    value.replace(tzinfo=None) if hasattr(value, "tzinfo") and value.tzinfo else value
+                    for value in row
+                ])
+        workbook.save(path)
+
+        with open(path, "rb") as exported:
+            while chunk := exported.read(FILE_CHUNK_SIZE):
+                yield chunk
+    finally:
+        os.remove(path)
@@ -0,0 +1,58 @@
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import case, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import school_locations_cache
+from app.models.asset import Asset
+from app.models.location import School, Area
+
+# (asset_id, school_name, area_name)
+AssetLocation = Tuple[int, Optional[str], Optional[str]]
+
+
+def school_location(db: Session, school_id: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Nama sekolah dan area dari cache school_id -> (nama sekolah, nama area).
+    """
+    if school_id is None:
+        return None, None
+
+    def load():
+        row = db.execute(
+            select(School.name, Area.name)
+            .outerjoin(Area, Area.id == School.area_id)
+            .where(School.id == school_id)
+        ).first()
+        return tuple(row) if row else (None, None)
+
+    return school_locations_cache.get_or_load(school_id, load)
+
+
+def resolve_asset_identifier(db: Session, code: str) -> Optional[AssetLocation]:
+    """
+    Mencari aset dari barcode atau serial number (barcode diutamakan) di transaksi `db`.
+    asset_id selalu dibaca dari database karena dipakai sebagai foreign key;
+    hanya nama sekolah/area yang diambil dari cache.
+    """
+    row = db.execute(
+        select(Asset.id, Asset.school_id)
+        .where(or_(Asset.barcode == code, Asset.serial_number == code))
+        .order_by(case((Asset.barcode == code, 0), else_=1), Asset.id)
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    asset_id, school_id = row
+    return (asset_id, *school_location(db, school_id))
+
+
+def invalidate_school_locations(school_ids: Optional[Iterable[int]] = None):
+    """
+    Menghapus sekolah tertentu dari cache, atau seluruh cache bila `school_ids` None
+    (mis. setelah sekolah dipindahkan ke area lain).
+    """
+    if school_ids is None:
+        school_locations_cache.invalidate()
+        return
+    for school_id in school_ids:
+        school_locations_cache.invalidate(school_id)
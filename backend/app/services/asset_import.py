@@ -0,0 +1,337 @@
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+from openpyxl import load_workbook
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.location import School, Area
+from app.models.update_log import UpdateLog
+from app.schemas.asset import IP_PATTERN, MAC_PATTERN
+from app.services.dashboard_stats import stat_key, record_changes
+
+ALLOW_DUPLICATE_IP_CATEGORIES = [
+    'CCTV', 'CTV',
+    'Router', 'RTR',
+    'Switch', 'SWI',
+    'Access Point', 'ACC',
+    'FingerPrint', 'FIP'
+]
+
+# Kolom Excel -> kolom tabel assets
+COLUMN_MAP = {
+    'Barcode': 'barcode',
+    'Serial Number': 'serial_number',
+    'School ID': 'school_id',
+    'City Code': 'city_code',
+    'Type Code': 'type_code',
+    'Category Code': 'category_code',
+    'Subcategory Code': 'subcategory_code',
+    'Month': 'procurement_month',
+    'Year': 'procurement_year',
+    'Floor': 'floor',
+    'Sequence': 'sequence_number',
+    'Brand': 'brand',
+    'Model': 'model_series',
+    'Room': 'room',
+    'Placement': 'placement',
+    'IP Address': 'ip_address',
+    'MAC Address': 'mac_address',
+    'RAM': 'ram',
+    'Processor': 'processor',
+    'Storage': 'storage',
+    'OS': 'os',
+    'Username': 'username',
+    'Password': 'password',
+    'Assigned To': 'assigned_to',
+    'Status': 'status',
+}
+
+REQUIRED_COLUMNS = [
+    'Barcode', 'Serial Number', 'School ID', 'City Code', 'Type Code',
+    'Month', 'Year', 'Floor', 'Sequence'
+]
+
+ZERO_PAD = {'procurement_month': 2, 'floor': 2, 'sequence_number': 3}
+
+IN_CLAUSE_SIZE = 1000
+
+
+def _cell_to_text(value) -> Optional[str]:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def _text_column(series: pd.Series) -> pd.Series:
+    """
+    Sel kosong (NaN/None/spasi) menjadi None, bukan NaN: NaN bernilai truthy sehingga
+    akan dianggap sebagai MAC/IP yang terisi saat cek bentrok.
+    """
+    return pd.Series(
+        [_cell_to_text(value) if pd.notna(value) else None for value in series],
+        index=series.index, dtype=object
+    )
+
+
+def _invalid_format(series: pd.Series, pattern: str) -> pd.Series:
+    return pd.Series(
+        [value is not None and re.match(pattern, str(value)) is None for value in series],
+        index=series.index, dtype=bool
+    )
+
+
+def _chunked(values: List, size: int = IN_CLAUSE_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class AssetImporter:
+    """
+    Import aset secara massal: validasi satu sheet sekaligus dengan operasi pandas,
+    cek bentrok barcode/IP/MAC ke database dengan query IN, lalu insert per batch.
+    Hasil dan error per baris diakumulasi sehingga bisa dipanggil berulang per chunk.
+    """
+
+    def __init__(self, db: Session, actor: str, batch_size: int = 500):
+        self.db = db
+        self.actor = actor
+        self.batch_size = batch_size
+        self.success_count = 0
+        self.errors: List[str] = []
+        self._locations: Dict[int, Tuple[str, str]] = {}
+
+    def result(self) -> dict:
+        return {
+            "message": "Proses Import Selesai",
+            "success_count": self.success_count,
+            "errors": self.errors
+        }
+
+    def import_frame(self, df: pd.DataFrame, row_numbers: Optional[List[int]] = None) -> int:
+        """
+        Memproses satu DataFrame. `row_numbers` adalah nomor baris di file untuk tiap baris df
+        (default: baris data dimulai dari baris 2, tepat di bawah header).
+        Mengembalikan jumlah aset yang berhasil disimpan dari frame ini.
+        """
+        if df.empty:
+            return 0
+
+        df = df.reset_index(drop=True)
+        if row_numbers is None:
+            row_numbers = range(2, 2 + len(df))
+        row_numbers = pd.Series(list(row_numbers))
+        records, row_errors = self._normalize(df)
+
+        valid = row_errors.isna()
+        if valid.any():
+            conflicts = self._find_conflicts(records[valid])
+            for idx, message in conflicts.items():
+                row_errors[idx] = message
+            valid = row_errors.isna()
+
+        inserted = self._insert(records[valid], row_numbers[valid], row_errors)
+
+        failed = row_errors.notna()
+        for row_no, message in zip(row_numbers[failed], row_errors[failed]):
+            self.errors.append(f"Baris {row_no}: {message}")
+
+        self.success_count += inserted
+        return inserted
+
+    def _normalize(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        errors = pd.Series(None, index=df.index, dtype=object)
+
+        def flag(mask: pd.Series, message):
+            nonlocal errors
+            errors = errors.mask(errors.isna() & mask.astype(bool), message)
+
+        records = pd.DataFrame(index=df.index)
+        for column, field in COLUMN_MAP.items():
+            if column in df.columns:
+                records[field] = _text_column(df[column])
+            else:
+                records[field] = None
+
+        for column in REQUIRED_COLUMNS:
+            flag(records[COLUMN_MAP[column]].isna(), f"Kolom '{column}' wajib diisi")
+
+        school_ids = pd.to_numeric(records['school_id'], errors='coerce')
+        flag(records['school_id'].notna() & (school_ids.isna() | (school_ids % 1 != 0)), "School ID harus berupa angka")
+        records['school_id'] = school_ids.where(school_ids.notna() & (school_ids % 1 == 0), None)
+
+        for field, width in ZERO_PAD.items():
+            present = records[field].notna()
+            records.loc[present, field] = records.loc[present, field].astype(str).str.zfill(width)
+
+        records['status'] = records['status'].fillna("Berfungsi")
+
+        flag(_invalid_format(records['ip_address'], IP_PATTERN), 'Format IP Address salah!')
+        flag(_invalid_format(records['mac_address'], MAC_PATTERN), 'Format MAC Address salah!')
+
+        return records, errors
+
+    def _find_conflicts(self, records: pd.DataFrame) -> Dict[int, str]:
+        barcodes = records['barcode'].dropna().unique().tolist()
+        macs = records['mac_address'].dropna().unique().tolist()
+        ip_checked = records['ip_address'].notna() & ~records['category_code'].isin(ALLOW_DUPLICATE_IP_CATEGORIES)
+        ips = records['ip_address'].dropna().unique().tolist()
+
+        taken_barcodes = self._existing_values(Asset.barcode, barcodes)
+        taken_macs = self._existing_values(Asset.mac_address, macs)
+        taken_ips = self._existing_values(Asset.ip_address, ips)
+
+        school_ids = records['school_id'].dropna().astype(int).unique().tolist()
+        self._load_locations(school_ids)
+
+        # Satu pass linear dengan set di memori, urutan baris tetap dihormati:
+        # baris yang lebih dulu diterima "memiliki" barcode/MAC/IP tersebut.
+        conflicts = {}
+        columns = ['barcode', 'school_id', 'mac_address', 'ip_address', 'category_code']
+        for idx, barcode, school_id, mac, ip, category in records[columns].itertuples(name=None):
+            if int(school_id) not in self._locations:
+                conflicts[idx] = f"Sekolah dengan ID {int(school_id)} tidak ditemukan"
+            elif barcode in taken_barcodes:
+                conflicts[idx] = f"Barcode {barcode} sudah terdaftar!"
+            elif pd.notna(mac) and mac in taken_macs:
+                conflicts[idx] = f"MAC Address '{mac}' sudah digunakan aset lain."
+            elif pd.notna(ip) and ip_checked[idx] and ip in taken_ips:
+                conflicts[idx] = f"IP Address '{ip}' sudah ada. IP harus unik untuk kategori {category}."
+            else:
+                taken_barcodes.add(barcode)
+                if pd.notna(mac):
+                    taken_macs.add(mac)
+                if pd.notna(ip):
+                    taken_ips.add(ip)
+        return conflicts
+
+    def _existing_values(self, column, values: List[str]) -> set:
+        found = set()
+        for chunk in _chunked(values):
+            found.update(v for (v,) in self.db.execute(select(column).where(column.in_(chunk))))
+        return found
+
+    def _load_locations(self, school_ids: List[int]):
+        missing = [sid for sid in school_ids if sid not in self._locations]
+        for chunk in _chunked(missing):
+            rows = self.db.execute(
+                select(School.id, School.name, Area.name)
+                .outerjoin(Area, School.area_id == Area.id)
+                .where(School.id.in_(chunk))
+            )
+            for school_id, school_name, area_name in rows:
+                self._locations[school_id] = (school_name, area_name or "Unknown Area")
+
+    def _insert(self, records: pd.DataFrame, row_numbers: pd.Series, row_errors: pd.Series) -> int:
+        if records.empty:
+            return 0
+
+        records = records.astype(object).where(records.notna(), None)
+        records['school_id'] = records['school_id'].astype(int)
+        rows = records.to_dict('records')
+        indexes = records.index.tolist()
+
+        inserted = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            batch_idx = indexes[start:start + self.batch_size]
+            try:
+                self._insert_batch(batch)
+                self.db.commit()
+                inserted += len(batch)
+            except SQLAlchemyError:
+                # Batch gagal (mis. bentrok dengan data yang masuk bersamaan):
+                # ulangi per baris dengan savepoint agar laporan error tetap per baris.
+                self.db.rollback()
+                for idx, row in zip(batch_idx, batch):
+                    try:
+                        with self.db.begin_nested():
+                            self._insert_batch([row])
+                        inserted += 1
+                    except SQLAlchemyError as e:
+                        row_errors[idx] = str(e.orig if getattr(e, 'orig', None) else e)
+                self.db.commit()
+        return inserted
+
+    def _insert_batch(self, rows: List[dict]):
+        created = self.db.execute(
+            insert(Asset).returning(
+                Asset.barcode, Asset.school_id, Asset.brand, Asset.model_series,
+                Asset.type_code, Asset.status, Asset.procurement_month
+            ),
+            rows
+        ).all()
+        record_changes(self.db, added=[stat_key(row) for row in created])
+
+        logs = []
+        for barcode, school_id, brand, model_series, *_ in created:
+            school_name, area_name = self._locations.get(school_id, ("Unknown School", "Unknown Area"))
+            logs.append({
+                "asset_barcode": barcode,
+                "asset_name": f"{brand or ''} - {model_series or ''}",
+                "action": "IMPORT",
+                "details": "Bulk Import via Excel",
+                "actor": self.actor,
+                "school_name": school_name,
+                "area_name": area_name
+            })
+        self.db.execute(insert(UpdateLog), logs)
+
+
+def iter_excel_chunks(path: str, chunk_size: int) -> Iterator[Tuple[pd.DataFrame, List[int]]]:
+    """
+    Membaca .xlsx secara streaming (openpyxl read-only) dan menghasilkan potongan
+    DataFrame berisi maksimal `chunk_size` baris beserta nomor baris aslinya.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(h).strip() if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+
+        buffer, numbers = [], []
+        for row_no, values in enumerate(rows, start=2):
+            if all(v is None or (isinstance(v, str) and not v.strip()) for v in values):
+                continue
+            buffer.append(values)
+            numbers.append(row_no)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=columns, dtype=object), numbers
+                buffer, numbers = [], []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns, dtype=object), numbers
+    finally:
+        workbook.close()
+
+
+def iter_csv_chunks(path: str, chunk_size: int) -> Iterator[Tuple[pd.DataFrame, List[int]]]:
+    reader = pd.read_csv(path, dtype=object, chunksize=chunk_size, skipinitialspace=True)
+    for chunk in reader:
+        yield chunk, [idx + 2 for idx in chunk.index]
+
+
+def import_file(
+    importer: AssetImporter,
+    path: str,
+    filename: str,
+    chunk_size: int,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> dict:
+    """
+    Import file yang sudah disimpan di disk per chunk sehingga memori tetap konstan
+    berapapun ukuran file. Setiap chunk di-commit sendiri oleh AssetImporter;
+    `on_progress` dipanggil dengan jumlah baris yang sudah diproses setelah tiap chunk.
+    """
+    chunks = iter_csv_chunks if filename.lower().endswith('.csv') else iter_excel_chunks
+    rows_processed = 0
+    for df, row_numbers in chunks(path, chunk_size):
+        importer.import_frame(df, row_numbers)
+        rows_processed += len(df)
+        if on_progress:
+            on_progress(rows_processed)
+    return importer.result()
@@ -0,0 +1,45 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import or_, select
+from sqlalchemy.sql import Select
+
+from app.models.asset import Asset
+from app.models.location import School, Area
+
+SCAN_COLUMNS = (
+    Asset.id, Asset.barcode, Asset.serial_number, Asset.brand, Asset.model_series, Asset.status,
+    Asset.school_id, School.name.label("school_name"), Area.name.label("area_name"), Asset.floor, Asset.room
+)
+
+
+def scan_lookup_query(codes: List[str]) -> Select:
+    """
+    Satu query ber-index (barcode atau serial_number) untuk semua kode hasil scan,
+    berikut nama sekolah & area dalam proyeksi ringkas.
+    """
+    return (
+        select(*SCAN_COLUMNS)
+        .outerjoin(School, School.id == Asset.school_id)
+        .outerjoin(Area, Area.id == School.area_id)
+        .where(or_(Asset.barcode.in_(codes), Asset.serial_number.in_(codes)))
+        .order_by(Asset.id)
+    )
+
+
+def match_scanned_codes(codes: List[str], rows) -> Iterator[Tuple[str, Optional[str], List[Dict]]]:
+    """
+    Memasangkan setiap kode dengan baris hasil scan_lookup_query(): (kode, matched_by, rows).
+    Barcode diutamakan; serial number bisa cocok ke lebih dari satu aset.
+    Kode yang tidak dikenal menghasilkan (kode, None, []).
+    """
+    by_barcode = {row["barcode"]: row for row in rows}
+    by_serial: Dict[str, List] = {}
+    for row in rows:
+        by_serial.setdefault(row["serial_number"], []).append(row)
+
+    for code in codes:
+        if code in by_barcode:
+            yield code, "barcode", [by_barcode[code]]
+        elif code in by_serial:
+            yield code, "serial_number", by_serial[code]
+        else:
+            yield code, None, []
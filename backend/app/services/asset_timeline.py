@@ -0,0 +1,126 @@
+import base64
+import json
+from datetime import date, datetime, time, timezone
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Date, and_, false, func, literal, or_, select, true
+
+from app.core.pagination import comparable_column, comparable_value
+from app.models.asset import Asset
+from app.models.service_history import ServiceHistory
+from app.models.update_log import UpdateLog
+
+# Urutan entri pada timestamp yang sama: log sebelum servis (urutan menurun)
+KIND_RANK = {"service": 0, "log": 1}
+
+# Tanggal servis; tiket tanpa service_date memakai tanggal dibuat
+SERVICE_DATE = func.coalesce(ServiceHistory.service_date, func.date(ServiceHistory.created_at), type_=Date)
+
+
+def sort_key(kind: str, timestamp, row_id: int) -> tuple:
+    """
+    Kunci urutan gabungan. Tanggal servis dianggap pukul 00:00, datetime ber-timezone
+    dinormalisasi ke UTC agar log (datetime) dan servis (date) bisa dibandingkan.
+    """
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.combine(timestamp, time.min)
+    elif timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp, KIND_RANK[kind], row_id
+
+
+def encode_timeline_cursor(kind: str, timestamp, row_id: int) -> str:
+    payload = json.dumps([kind, timestamp.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_timeline_cursor(cursor: str) -> Tuple[str, object, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if kind not in KIND_RANK or not isinstance(row_id, int):
+            raise ValueError("cursor tidak dikenal")
+        timestamp = date.fromisoformat(value) if kind == "service" else datetime.fromisoformat(value)
+        return kind, timestamp, row_id
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Cursor timeline tidak valid")
+
+
+def _log_after(cursor: Tuple[str, object, int], dialect_name: str):
+    kind, timestamp, row_id = cursor
+    created_at = comparable_column(UpdateLog.created_at, dialect_name)
+    if kind == "log":
+        timestamp = comparable_value(timestamp, dialect_name)
+        return or_(
+            created_at < timestamp,
+            and_(created_at == timestamp, UpdateLog.id < row_id)
+        )
+    # Cursor servis = pukul 00:00 tanggal tersebut; log tepat pukul 00:00 sudah tampil sebelumnya
+    midnight = datetime.combine(timestamp, time.min)
+    if dialect_name == "postgresql":
+        midnight = midnight.replace(tzinfo=timezone.utc)
+    return created_at < comparable_value(midnight, dialect_name)
+
+
+def _service_after(cursor: Tuple[str, object, int]):
+    kind, timestamp, row_id = cursor
+    if kind == "service":
+        return or_(SERVICE_DATE < timestamp, and_(SERVICE_DATE == timestamp, ServiceHistory.id < row_id))
+    # Servis pada tanggal yang sama dengan log cursor selalu diurutkan sesudah log tersebut
+    return SERVICE_DATE <= sort_key(kind, timestamp, row_id)[0].date()
+
+
+def timeline_statements(asset: Asset, size: int, cursor: Optional[str], dialect_name: str) -> tuple:
+    """
+    Dua query terpisah (log & servis), masing-masing memakai index
+    (asset_barcode, created_at) / (sn_or_barcode, service_date) dengan pencocokan persis,
+    bukan ILIKE. Setiap query mengambil paling banyak size + 1 baris setelah cursor.
+    """
+    decoded = decode_timeline_cursor(cursor) if cursor else None
+
+    logs = (
+        select(
+            literal("log").label("kind"), UpdateLog.id, UpdateLog.created_at.label("timestamp"),
+            UpdateLog.action, UpdateLog.details, UpdateLog.actor,
+            UpdateLog.school_name, UpdateLog.area_name
+        )
+        .where(UpdateLog.asset_barcode == asset.barcode, _log_after(decoded, dialect_name) if decoded else true())
+        .order_by(comparable_column(UpdateLog.created_at, dialect_name).desc(), UpdateLog.id.desc())
+        .limit(size + 1)
+    )
+
+    codes = [code for code in (asset.barcode, asset.serial_number) if code]
+    services = (
+        select(
+            literal("service").label("kind"), ServiceHistory.id, SERVICE_DATE.label("timestamp"),
+            ServiceHistory.ticket_no, ServiceHistory.issue_description.label("details"),
+            ServiceHistory.vendor, ServiceHistory.status
+        )
+        .where(
+            or_(
+                ServiceHistory.asset_id == asset.id,
+                ServiceHistory.sn_or_barcode.in_(codes) if codes else false()
+            ),
+            _service_after(decoded) if decoded else true()
+        )
+        .order_by(SERVICE_DATE.desc(), ServiceHistory.id.desc())
+        .limit(size + 1)
+    )
+    return logs, services
+
+
+def merge_timeline(log_rows: List, service_rows: List, size: int) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Menggabungkan dua aliran yang sudah terurut menjadi satu halaman, terbaru lebih dulu.
+    """
+    rows = sorted(
+        (dict(row) for row in [*log_rows, *service_rows]),
+        key=lambda row: sort_key(row["kind"], row["timestamp"], row["id"]),
+        reverse=True
+    )
+    items = rows[:size]
+    next_cursor = None
+    if len(rows) > size and items:
+        last = items[-1]
+        next_cursor = encode_timeline_cursor(last["kind"], last["timestamp"], last["id"])
+    return items, next_cursor
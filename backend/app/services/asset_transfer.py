@@ -0,0 +1,74 @@
+from typing import Dict, List
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.location import School
+from app.models.update_log import UpdateLog
+from app.services.dashboard_stats import KEY_FIELDS, stat_key, record_changes
+
+
+def transfer_assets(
+    db: Session,
+    target_school: School,
+    asset_ids: List[int],
+    new_room: str,
+    new_floor: str,
+    actor: str = "Admin"
+) -> List[Dict]:
+    """
+    Memindahkan banyak aset ke satu sekolah dalam satu transaksi:
+    satu SELECT ... IN (dengan nama sekolah asal), satu UPDATE, satu INSERT log
+    dan satu upsert asset_stats. Mengembalikan hasil per id (moved / not_found)
+    sesuai urutan input; commit dilakukan oleh pemanggil.
+    """
+    ids = list(dict.fromkeys(asset_ids))
+    if not ids:
+        return []
+
+    rows = db.execute(
+        select(
+            Asset.id, Asset.barcode, Asset.brand, Asset.model_series,
+            *(getattr(Asset, field) for field in KEY_FIELDS if field != "school_id"),
+            Asset.school_id, School.name.label("school_name")
+        )
+        .outerjoin(School, School.id == Asset.school_id)
+        .where(Asset.id.in_(ids))
+    ).mappings().all()
+    found = {row["id"]: row for row in rows}
+    moved = [found[asset_id] for asset_id in ids if asset_id in found]
+
+    if moved:
+        db.execute(
+            update(Asset)
+            .where(Asset.id.in_([row["id"] for row in moved]))
+            .values(school_id=target_school.id, room=new_room, floor=new_floor)
+            .execution_options(synchronize_session=False)
+        )
+
+        area_name = target_school.area.name if target_school.area else "Unknown Area"
+        db.execute(insert(UpdateLog), [
+            {
+                "asset_barcode": row["barcode"],
+                "asset_name": f"{row['brand']} - {row['model_series']}",
+                "action": "ASSET TRANSFER",
+                "details": f"Dipindahkan dari {row['school_name'] or 'Unknown'} ke {target_school.name}",
+                "actor": actor,
+                "school_name": target_school.name,
+                "area_name": area_name
+            }
+            for row in moved
+        ])
+
+        record_changes(
+            db,
+            added=[stat_key(dict(row, school_id=target_school.id)) for row in moved],
+            removed=[stat_key(row) for row in moved]
+        )
+
+    return [
+        {"asset_id": asset_id, "barcode": found[asset_id]["barcode"], "status": "moved"}
+        if asset_id in found else
+        {"asset_id": asset_id, "barcode": None, "status": "not_found"}
+        for asset_id in ids
+    ]
@@ -0,0 +1,169 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List
+from sqlalchemy import insert, literal, or_, select, true, update
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.audit import AuditSession, AuditItem
+from app.models.location import School
+from app.services.asset_scan import scan_lookup_query, match_scanned_codes
+
+# Hasil scan yang dicatat sebagai selisih, beserta counter-nya di audit_sessions
+RESULT_COUNTERS = {
+    "matched": "matched_count",
+    "wrong_location": "wrong_location_count",
+    "unexpected": "unexpected_count",
+    "unknown": "unknown_count",
+}
+
+
+def location_conditions(session: AuditSession) -> list:
+    conditions = [Asset.school_id == session.school_id]
+    if session.floor:
+        conditions.append(Asset.floor == session.floor)
+    if session.room:
+        conditions.append(Asset.room == session.room)
+    return conditions
+
+
+def in_audit_location(session: AuditSession, row) -> bool:
+    return (
+        row["school_id"] == session.school_id
+        and (not session.floor or row["floor"] == session.floor)
+        and (not session.room or row["room"] == session.room)
+    )
+
+
+def open_session(db: Session, school_id: int, floor: str, room: str, actor: str) -> AuditSession:
+    """
+    Membuka sesi audit dan menyalin daftar aset yang seharusnya ada di lokasi tersebut
+    ke audit_items dengan satu INSERT ... SELECT.
+    """
+    session = AuditSession(school_id=school_id, floor=floor or None, room=room or None, opened_by=actor)
+    db.add(session)
+    db.flush()
+
+    result = db.execute(
+        insert(AuditItem).from_select(
+            ["session_id", "asset_id", "barcode", "expected", "result"],
+            select(literal(session.id), Asset.id, Asset.barcode, true(), literal("pending"))
+            .where(*location_conditions(session))
+        )
+    )
+    session.expected_count = result.rowcount
+    db.commit()
+    db.refresh(session)
+    return session
+
+
+def record_scans(db: Session, session: AuditSession, codes: List[str]) -> List[Dict]:
+    """
+    Mencatat satu batch scan. Kode di-resolve dalam satu query, dicocokkan dengan
+    audit_items sesi ini saja (bukan seluruh inventaris sekolah), lalu:
+    - aset yang diharapkan & belum discan -> matched (satu UPDATE)
+    - aset sekolah yang sama di lantai/ruang lain -> wrong_location
+    - aset sekolah lain -> unexpected
+    - kode yang tidak terdaftar -> unknown
+    - kode/aset yang sudah tercatat -> duplicate (tidak mengubah apapun)
+    Counter selisih di audit_sessions ikut diperbarui di transaksi yang sama.
+    Sesi sebaiknya di-load dengan FOR UPDATE agar batch paralel tidak saling menimpa.
+    """
+    rows = db.execute(scan_lookup_query(codes)).mappings().all()
+    matches = list(match_scanned_codes(codes, rows))
+    asset_ids = {row["id"] for _, _, found in matches for row in found}
+    unknown_codes = [code for code, _, found in matches if not found]
+
+    existing = db.execute(
+        select(AuditItem.id, AuditItem.asset_id, AuditItem.code, AuditItem.result)
+        .where(
+            AuditItem.session_id == session.id,
+            or_(AuditItem.asset_id.in_(asset_ids), AuditItem.code.in_(unknown_codes))
+        )
+    ).all()
+    pending = {item.asset_id: item.id for item in existing if item.result == "pending"}
+    recorded_assets = {item.asset_id for item in existing if item.asset_id and item.result != "pending"}
+    recorded_codes = {item.code for item in existing if item.asset_id is None}
+
+    now = datetime.now(timezone.utc)
+    matched_ids, new_items, results = [], [], []
+    counts = Counter()
+
+    for code, _, found in matches:
+        if not found:
+            if code in recorded_codes:
+                results.append({"code": code, "result": "duplicate"})
+                continue
+            recorded_codes.add(code)
+            new_items.append({
+                "session_id": session.id, "asset_id": None, "barcode": None, "code": code,
+                "expected": False, "result": "unknown", "scanned_at": now
+            })
+            counts["unknown"] += 1
+            results.append({"code": code, "result": "unknown"})
+            continue
+
+        for row in found:
+            asset_id = row["id"]
+            if asset_id in recorded_assets:
+                result = "duplicate"
+            elif asset_id in pending:
+                result = "matched"
+                matched_ids.append(pending.pop(asset_id))
+            else:
+                # Aset yang dipindah ke lokasi ini setelah sesi dibuka tetap dihitung sesuai
+                if in_audit_location(session, row):
+                    result = "matched"
+                    counts["expected"] += 1
+                elif row["school_id"] == session.school_id:
+                    result = "wrong_location"
+                else:
+                    result = "unexpected"
+                new_items.append({
+                    "session_id": session.id, "asset_id": asset_id, "barcode": row["barcode"], "code": code,
+                    "expected": result == "matched", "result": result, "scanned_at": now
+                })
+
+            if result != "duplicate":
+                recorded_assets.add(asset_id)
+                counts[result] += 1
+            results.append({"code": code, "result": result, "asset_id": asset_id, "barcode": row["barcode"]})
+
+    if matched_ids:
+        db.execute(
+            update(AuditItem)
+            .where(AuditItem.id.in_(matched_ids), AuditItem.result == "pending")
+            .values(result="matched", scanned_at=now)
+        )
+    if new_items:
+        db.execute(insert(AuditItem), new_items)
+
+    session.expected_count += counts["expected"]
+    for result, counter in RESULT_COUNTERS.items():
+        setattr(session, counter, getattr(session, counter) + counts[result])
+    db.commit()
+    db.refresh(session)
+    return results
+
+
+def session_diff(db: Session, session: AuditSession) -> Dict[str, List]:
+    """
+    Selisih audit dari audit_items sesi ini: pending = missing, sisanya sesuai hasil scan.
+    """
+    rows = db.execute(
+        select(
+            AuditItem.result, AuditItem.asset_id, AuditItem.barcode, AuditItem.code, AuditItem.scanned_at,
+            Asset.brand, Asset.model_series, Asset.school_id, School.name.label("school_name"),
+            Asset.floor, Asset.room
+        )
+        .outerjoin(Asset, Asset.id == AuditItem.asset_id)
+        .outerjoin(School, School.id == Asset.school_id)
+        .where(AuditItem.session_id == session.id, AuditItem.result != "matched")
+        .order_by(AuditItem.id)
+    ).mappings().all()
+
+    diff = {"missing": [], "wrong_location": [], "unexpected": [], "unknown": []}
+    for row in rows:
+        bucket = "missing" if row["result"] == "pending" else row["result"]
+        diff[bucket].append(row)
+    return diff
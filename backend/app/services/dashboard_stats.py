@@ -0,0 +1,154 @@
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import dialect_insert
+from app.models.asset import Asset
+from app.models.asset_stat import AssetStat
+from app.models.location import School, Area
+
+StatKey = Tuple[int, str, str, str]
+
+KEY_FIELDS = ("school_id", "type_code", "status", "procurement_month")
+
+ATTENTION_STATUSES = ["Rusak", "Perbaikan", "Terkendala"]
+MONTHS = ["01","02","03","04","05","06","07","08","09","10","11","12"]
+
+
+def stat_key(asset) -> StatKey:
+    """
+    Kunci ringkasan untuk satu aset. Menerima objek Asset, Row, atau dict.
+    """
+    if isinstance(asset, dict):
+        return tuple(asset[field] for field in KEY_FIELDS)
+    return tuple(getattr(asset, field) for field in KEY_FIELDS)
+
+
+def record_changes(
+    db: Session,
+    added: Iterable[StatKey] = (),
+    removed: Iterable[StatKey] = ()
+):
+    """
+    Menerapkan selisih jumlah aset ke tabel asset_stats di transaksi yang sama
+    dengan perubahan asetnya (upsert count = count + delta).
+    """
+    deltas = Counter(added)
+    deltas.subtract(Counter(removed))
+    rows = [
+        dict(zip(KEY_FIELDS, key), asset_count=delta)
+        for key, delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+
+    stmt = dialect_insert(db)(AssetStat)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(KEY_FIELDS),
+        set_={"asset_count": AssetStat.asset_count + stmt.excluded.asset_count}
+    )
+    db.execute(stmt, rows)
+
+
+def record_update(db: Session, old_key: StatKey, new_key: Optional[StatKey]):
+    if old_key != new_key:
+        record_changes(db, added=[new_key] if new_key else [], removed=[old_key])
+
+
+def rebuild_stats(db: Session) -> int:
+    """
+    Membangun ulang asset_stats dari tabel assets (perbaikan konsistensi).
+    Mengembalikan jumlah baris ringkasan.
+    """
+    db.execute(delete(AssetStat))
+    db.execute(
+        insert(AssetStat).from_select(
+            list(KEY_FIELDS) + ["asset_count"],
+            select(
+                Asset.school_id, Asset.type_code, Asset.status, Asset.procurement_month,
+                func.count(Asset.id)
+            ).group_by(Asset.school_id, Asset.type_code, Asset.status, Asset.procurement_month)
+        )
+    )
+    db.commit()
+    return db.query(AssetStat).count()
+
+
+def dashboard_summary_query(live: bool = False):
+    """
+    Semua angka dashboard dalam satu query: agregasi per (sekolah, status, bulan)
+    dengan COUNT/SUM ... FILTER untuk hardware, digabung dengan nama sekolah dan area.
+    `live=True` membaca langsung tabel assets (satu scan), default dari asset_stats.
+    """
+    if live:
+        source = Asset
+        total = func.count(Asset.id)
+        hardware = func.count(Asset.id).filter(Asset.type_code == "HW")
+    else:
+        source = AssetStat
+        total = func.sum(AssetStat.asset_count)
+        hardware = func.coalesce(func.sum(AssetStat.asset_count).filter(AssetStat.type_code == "HW"), 0)
+
+    grouped = (
+        select(
+            source.school_id.label("school_id"),
+            source.status.label("status"),
+            source.procurement_month.label("month"),
+            total.label("total"),
+            hardware.label("hardware")
+        )
+        .group_by(source.school_id, source.status, source.procurement_month)
+        .subquery()
+    )
+    return (
+        select(grouped, School.name, Area.id, Area.name)
+        .outerjoin(School, School.id == grouped.c.school_id)
+        .outerjoin(Area, Area.id == School.area_id)
+    )
+
+
+def summarize_dashboard_rows(rows) -> dict:
+    """
+    Menjumlahkan hasil dashboard_summary_query() menjadi total, per status,
+    per bulan, per sekolah dan per area.
+    """
+    summary = {
+        "total_assets": 0,
+        "total_hardware": 0,
+        "need_attention": 0,
+        "chart_data": {month: 0 for month in MONTHS},
+        "status_counts": {},
+    }
+    schools, areas = {}, {}
+    for school_id, status, month, count, hw, school_name, area_id, area_name in rows:
+        count, hw = int(count or 0), int(hw or 0)
+        if not count:
+            continue
+        attention = count if status in ATTENTION_STATUSES else 0
+
+        summary["total_assets"] += count
+        summary["total_hardware"] += hw
+        summary["need_attention"] += attention
+        if month in summary["chart_data"]:
+            summary["chart_data"][month] += count
+        summary["status_counts"][status] = summary["status_counts"].get(status, 0) + count
+
+        school = schools.setdefault(school_id, {
+            "school_id": school_id, "school_name": school_name,
+            "area_id": area_id, "area_name": area_name,
+            "total": 0, "hardware": 0, "need_attention": 0, "status_counts": {}
+        })
+        area = areas.setdefault(area_id, {
+            "area_id": area_id, "area_name": area_name or "Unknown Area",
+            "total": 0, "hardware": 0, "need_attention": 0, "status_counts": {}
+        })
+        for bucket in (school, area):
+            bucket["total"] += count
+            bucket["hardware"] += hw
+            bucket["need_attention"] += attention
+            bucket["status_counts"][status] = bucket["status_counts"].get(status, 0) + count
+
+    summary["areas"] = sorted(areas.values(), key=lambda a: a["total"], reverse=True)
+    summary["schools"] = sorted(schools.values(), key=lambda s: s["total"], reverse=True)
+    return summary
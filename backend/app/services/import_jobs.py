@@ -0,0 +1,166 @@
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.import_job import ImportJob
+from app.services.asset_import import AssetImporter, import_file
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Identitas proses yang mengklaim job, untuk diagnosa di tabel import_jobs
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.IMPORT_WORKERS, thread_name_prefix="import-job")
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def rows_per_second(job: ImportJob) -> Optional[float]:
+    if not job.started_at or not job.rows_processed:
+        return None
+    end = _as_utc(job.finished_at) if job.finished_at else _now()
+    elapsed = (end - _as_utc(job.started_at)).total_seconds()
+    return round(job.rows_processed / elapsed, 1) if elapsed > 0 else None
+
+
+def submit_import_job(db: Session, filename: str, file_path: str, actor: str) -> ImportJob:
+    """
+    Mencatat job import baru lalu menjadwalkannya di worker pool.
+    """
+    job = ImportJob(
+        filename=filename,
+        file_path=file_path,
+        actor=actor,
+        status="queued",
+        rows_processed=0,
+        success_count=0,
+        error_count=0,
+        errors=[]
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    get_executor().submit(run_import_job, job.id)
+    return job
+
+
+def claim_import_job(db: Session, job_id: int) -> bool:
+    """
+    Mengubah job dari "queued" ke "running" dengan satu UPDATE bersyarat.
+    Hanya satu worker yang mendapat rowcount 1, sehingga job tidak pernah dijalankan dua kali.
+    """
+    now = _now()
+    claimed = db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id, ImportJob.status == "queued")
+        .values(status="running", worker=WORKER_ID, started_at=now, heartbeat_at=now)
+    ).rowcount
+    db.commit()
+    return claimed == 1
+
+
+def run_import_job(job_id: int):
+    db = SessionLocal()
+    file_path = None
+    try:
+        if not claim_import_job(db, job_id):
+            return
+        job = db.get(ImportJob, job_id)
+        file_path = job.file_path
+
+        importer = AssetImporter(db, job.actor)
+
+        def save_progress(rows_processed: int):
+            job.heartbeat_at = _now()
+            job.rows_processed = rows_processed
+            job.success_count = importer.success_count
+            job.error_count = len(importer.errors)
+            job.errors = list(importer.errors)
+            db.commit()
+
+        try:
+            result = import_file(importer, file_path, job.filename, settings.IMPORT_CHUNK_SIZE, save_progress)
+            job.status = "completed"
+            job.message = result["message"]
+        except Exception as e:
+            db.rollback()
+            job.status = "failed"
+            job.message = f"Gagal memproses file: {str(e)}"
+
+        job.success_count = importer.success_count
+        job.error_count = len(importer.errors)
+        job.errors = list(importer.errors)
+        job.file_path = None
+        job.finished_at = _now()
+        db.commit()
+    finally:
+        db.close()
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def recover_import_jobs():
+    """
+    Dipanggil saat startup setiap worker. Job "running" yang heartbeat-nya lebih tua dari
+    IMPORT_JOB_STALE_SECONDS ditandai gagal (workernya mati, sebagian baris mungkin sudah
+    tersimpan); job yang masih diproses worker lain tidak disentuh. Job yang masih antre
+    dijadwalkan ulang, run_import_job memastikan hanya satu worker yang menjalankannya.
+    """
+    db = SessionLocal()
+    try:
+        cutoff = _now() - timedelta(seconds=settings.IMPORT_JOB_STALE_SECONDS)
+        stale = or_(ImportJob.heartbeat_at < cutoff, ImportJob.heartbeat_at.is_(None) & (ImportJob.started_at < cutoff))
+        interrupted = db.query(ImportJob.id, ImportJob.file_path).filter(ImportJob.status == "running", stale).all()
+        for job_id, file_path in interrupted:
+            failed = db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.status == "running", stale)
+                .values(
+                    status="failed",
+                    message="Import terhenti karena server dimatikan. Periksa data lalu upload ulang baris yang belum masuk.",
+                    finished_at=_now(),
+                    file_path=None
+                )
+            ).rowcount
+            db.commit()
+            if failed and file_path and os.path.exists(file_path):
+                os.remove(file_path)
+
+        queued = db.query(ImportJob.id, ImportJob.file_path, ImportJob.created_at).filter(ImportJob.status == "queued").all()
+        for job_id, file_path, created_at in queued:
+            if file_path and os.path.exists(file_path):
+                get_executor().submit(run_import_job, job_id)
+            elif created_at is None or _as_utc(created_at) < cutoff:
+                # File baru bisa saja belum terlihat dari worker ini; hanya job lama yang digagalkan
+                db.execute(
+                    update(ImportJob)
+                    .where(ImportJob.id == job_id, ImportJob.status == "queued")
+                    .values(status="failed", message="File import tidak ditemukan", finished_at=_now())
+                )
+        db.commit()
+    finally:
+        db.close()
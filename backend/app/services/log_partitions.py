@@ -0,0 +1,240 @@
+import csv
+import gzip
+import os
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.update_log import UpdateLog
+
+PARENT_TABLE = "update_logs"
+DEFAULT_PARTITION = "update_logs_default"
+ARCHIVE_BATCH_SIZE = 5000
+ARCHIVE_COLUMNS = [column.name for column in UpdateLog.__table__.columns]
+# Kunci advisory bersama untuk semua proses yang mengubah partisi update_logs
+PARTITION_LOCK_KEY = 0x75706C67
+DUPLICATE_TABLE = "42P07"
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+def month_bounds(month: date) -> Tuple[datetime, datetime]:
+    """
+    Batas partisi bulanan dalam UTC, sama dengan batas yang dibuat migrasi.
+    """
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    upper_month = add_months(month, 1)
+    return lower, datetime(upper_month.year, upper_month.month, 1, tzinfo=timezone.utc)
+
+
+def is_partitioned(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(db.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :parent)"
+    ), {"parent": PARENT_TABLE}).scalar())
+
+
+def lock_partitions(db: Session):
+    """
+    Menahan kunci advisory sampai transaksi `db` selesai, sehingga worker yang start
+    bersamaan (dan perintah arsip) tidak membuat / melepas partisi secara bersamaan.
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+
+def list_partitions(db: Session) -> List[Tuple[str, date]]:
+    """
+    Partisi bulanan yang menempel di update_logs, terurut dari bulan terlama.
+    """
+    names = db.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :parent"
+    ), {"parent": PARENT_TABLE}).scalars()
+
+    prefix = f"{PARENT_TABLE}_p"
+    partitions = []
+    for name in names:
+        suffix = name[len(prefix):] if name.startswith(prefix) else ""
+        if len(suffix) == 6 and suffix.isdigit():
+            partitions.append((name, date(int(suffix[:4]), int(suffix[4:]), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def create_partition(db: Session, month: date) -> bool:
+    """
+    Membuat partisi satu bulan bila belum ada. Baris bulan tersebut yang terlanjur masuk
+    ke partisi default dipindahkan dulu, karena PostgreSQL menolak partisi baru yang
+    rentangnya sudah berisi data di default.
+    """
+    name = partition_name(month)
+    if db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        return False
+
+    lower, upper = month_bounds(month)
+    bounds = {"lower": lower, "upper": upper}
+    stranded = db.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :lower AND created_at < :upper)"
+    ), bounds).scalar()
+
+    try:
+        with db.begin_nested():
+            if stranded:
+                db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+            db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            ))
+            if stranded:
+                db.execute(text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :lower AND created_at < :upper RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ), bounds)
+                db.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    except ProgrammingError as e:
+        # Dibuat proses lain yang tidak memakai kunci (mis. migrasi): dianggap berhasil
+        if getattr(e.orig, "pgcode", None) != DUPLICATE_TABLE:
+            raise
+        return False
+    return True
+
+
+def ensure_partitions(db: Session, months_ahead: Optional[int] = None) -> List[str]:
+    """
+    Menyiapkan partisi bulan berjalan sampai `months_ahead` bulan ke depan, di bawah
+    kunci advisory sehingga aman dijalankan bersamaan oleh beberapa worker.
+    Tidak melakukan apapun bila update_logs bukan tabel partisi (SQLite / belum migrasi).
+    """
+    if not is_partitioned(db):
+        return []
+    lock_partitions(db)
+
+    months_ahead = settings.LOG_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    current = month_start(datetime.now(timezone.utc).date())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if create_partition(db, month):
+            created.append(partition_name(month))
+    db.commit()
+    return created
+
+
+def ensure_log_partitions():
+    """
+    Dipanggil saat startup agar insert log selalu jatuh ke partisi bulanannya.
+    """
+    db = SessionLocal()
+    try:
+        ensure_partitions(db)
+    finally:
+        db.close()
+
+
+def archive_path(archive_dir: str, month: date) -> str:
+    base = os.path.join(archive_dir, f"{PARENT_TABLE}_{month:%Y-%m}")
+    path, counter = f"{base}.csv.gz", 1
+    while os.path.exists(path):
+        path = f"{base}.{counter}.csv.gz"
+        counter += 1
+    return path
+
+
+def write_archive(db: Session, month: date, path: str) -> int:
+    """
+    Menyalin log satu bulan ke CSV gzip secara streaming (yield_per), lewat file sementara
+    agar arsip yang setengah jadi tidak pernah terlihat dengan nama akhirnya.
+    """
+    lower, upper = month_bounds(month)
+    rows = db.execute(
+        select(*UpdateLog.__table__.columns)
+        .where(UpdateLog.created_at >= lower, UpdateLog.created_at < upper)
+        .order_by(UpdateLog.id)
+        .execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+    )
+
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", newline="", encoding="utf-8") as archive:
+        writer = csv.writer(archive)
+        writer.writerow(ARCHIVE_COLUMNS)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def archivable_months(db: Session, before: date) -> List[date]:
+    if is_partitioned(db):
+        return [month for _, month in list_partitions(db) if add_months(month, 1) <= before]
+
+    oldest = db.execute(select(func.min(UpdateLog.created_at))).scalar()
+    if oldest is None:
+        return []
+    if isinstance(oldest, datetime) and oldest.tzinfo is not None:
+        oldest = oldest.astimezone(timezone.utc)
+    months, month = [], month_start(oldest.date() if isinstance(oldest, datetime) else oldest)
+    while month < before:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def archive_logs(db: Session, retention_months: int, archive_dir: str, dry_run: bool = False) -> List[Dict]:
+    """
+    Memindahkan log yang lebih tua dari `retention_months` bulan ke file CSV gzip per bulan.
+    Tabel partisi: partisi bulan tersebut di-DETACH lalu DROP (tanpa DELETE per baris).
+    Tabel biasa (fallback): baris bulan tersebut di-DELETE setelah arsip tertulis.
+    Setiap bulan di-commit terpisah sehingga proses bisa diulang bila terhenti.
+    """
+    before = add_months(month_start(datetime.now(timezone.utc).date()), -retention_months)
+    partitioned = is_partitioned(db)
+    if not dry_run:
+        os.makedirs(archive_dir, exist_ok=True)
+
+    results = []
+    for month in archivable_months(db, before):
+        if dry_run:
+            lower, upper = month_bounds(month)
+            count = db.execute(
+                select(func.count()).select_from(UpdateLog).where(UpdateLog.created_at >= lower, UpdateLog.created_at < upper)
+            ).scalar()
+            if count:
+                results.append({"month": f"{month:%Y-%m}", "rows": count, "file": None})
+            continue
+
+        path = archive_path(archive_dir, month)
+        count = write_archive(db, month, path)
+        if partitioned:
+            lock_partitions(db)
+            name = partition_name(month)
+            db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            db.execute(text(f"DROP TABLE {name}"))
+        else:
+            lower, upper = month_bounds(month)
+            db.execute(delete(UpdateLog).where(UpdateLog.created_at >= lower, UpdateLog.created_at < upper))
+        db.commit()
+
+        if count:
+            results.append({"month": f"{month:%Y-%m}", "rows": count, "file": path})
+        else:
+            os.remove(path)
+    return results
@@ -0,0 +1,258 @@
+import atexit
+import glob
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.update_log import UpdateLog
+
+try:
+    import fcntl
+except ImportError:  # Windows: spool dianggap milik satu proses saja
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "pending_update_logs"
+LOG_FIELDS = [column.name for column in UpdateLog.__table__.columns if column.name != "id"]
+
+
+def _lock(handle) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _serialize(entry: Dict) -> str:
+    return json.dumps({**entry, "created_at": entry["created_at"].isoformat()}, separators=(",", ":"))
+
+
+def _deserialize(line: str) -> Dict:
+    entry = json.loads(line)
+    entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+    return entry
+
+
+class UpdateLogWriter:
+    """
+    Penulis update_logs di belakang request (mode "async", opsional). Entri transaksi yang sudah
+    di-commit ditulis dulu ke spool (JSON lines, satu file per proses) lalu dimasukkan ke
+    database per batch dengan insert multi-baris oleh satu thread, saat jumlahnya mencapai
+    `batch_size` atau setiap `flush_seconds`. Spool yang tertinggal karena proses mati
+    dimasukkan ulang saat start().
+
+    Karena spool ditulis setelah commit, log tidak pernah dibuat untuk perubahan yang batal;
+    sebaliknya proses yang mati tepat di antara commit dan penulisan spool kehilangan log
+    transaksi tersebut. Gunakan mode "sync" (default) bila log harus atomik dengan datanya.
+    """
+
+    def __init__(self, spool_dir: str, batch_size: int, flush_seconds: float, fsync: bool = False):
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._buffer: List[Dict] = []
+        self._spool = None
+        self._failed: List[Tuple[Optional[str], object, List[Dict]]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._atexit_registered = False
+
+    def _open_spool(self):
+        os.makedirs(self.spool_dir, exist_ok=True)
+        path = os.path.join(self.spool_dir, f"update_logs-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl")
+        self._spool = open(path, "a", encoding="utf-8")
+        _lock(self._spool)
+
+    def start(self):
+        """
+        Memasukkan spool sisa proses sebelumnya, lalu menjalankan thread flush.
+        """
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            if self._spool is None:
+                self._open_spool()
+            self._thread = threading.Thread(target=self._run, name="update-log-writer", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+        self.recover()
+
+    def stop(self):
+        with self._lock:
+            thread, self._stopping = self._thread, True
+        self._wake.set()
+        if thread:
+            thread.join()
+        self.flush()
+        with self._lock:
+            if self._spool is not None and not self._buffer:
+                self._spool.close()
+                if os.path.exists(self._spool.name):
+                    os.remove(self._spool.name)
+                self._spool = None
+
+    def enqueue(self, entries: List[Dict]):
+        if not entries:
+            return
+        if not (self._thread and self._thread.is_alive()):
+            self.start()
+
+        with self._lock:
+            for entry in entries:
+                self._spool.write(_serialize(entry) + "\n")
+            self._spool.flush()
+            if self.fsync:
+                os.fsync(self._spool.fileno())
+            self._buffer.extend(entries)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Gagal menulis batch update_logs, dicoba lagi pada flush berikutnya")
+
+    def _insert(self, entries: List[Dict]):
+        db = SessionLocal()
+        try:
+            for start in range(0, len(entries), self.batch_size):
+                db.execute(insert(UpdateLog), entries[start:start + self.batch_size])
+            db.commit()
+        finally:
+            db.close()
+
+    def flush(self):
+        """
+        Memindahkan buffer ke database. File spool batch ini ditukar dengan file baru lebih dulu,
+        sehingga entri yang masuk selama insert tetap tercatat di spool yang aktif.
+        Batch yang gagal disimpan (beserta file spool-nya) dan dicoba lagi pada flush berikutnya.
+        Bila file spool hilang (mis. dihapus dari luar), batch tetap dimasukkan dari memori.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._buffer:
+                    batch_path = self._spool.name[:-len(".jsonl")] + ".batch"
+                    try:
+                        os.replace(self._spool.name, batch_path)
+                    except FileNotFoundError:
+                        logger.warning("Spool update_logs hilang: %s, batch dimasukkan dari memori", self._spool.name)
+                        batch_path = None
+                    self._failed.append((batch_path, self._spool, self._buffer))
+                    self._buffer = []
+                    self._open_spool()
+                pending, self._failed = self._failed, []
+
+            for index, (path, handle, entries) in enumerate(pending):
+                try:
+                    self._insert(entries)
+                except Exception:
+                    with self._lock:
+                        self._failed = pending[index:] + self._failed
+                    raise
+                handle.close()
+                if path:
+                    os.remove(path)
+
+    def recover(self) -> int:
+        """
+        Memasukkan spool yang tidak dipegang proses lain (lock dilepas saat proses mati).
+        Baris terakhir yang terpotong karena crash diabaikan.
+        """
+        own = {self._spool.name} if self._spool else set()
+        with self._lock:
+            own.update(path for path, _, _ in self._failed if path)
+
+        recovered = 0
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, "update_logs-*"))):
+            if path in own:
+                continue
+            try:
+                handle = open(path, "r+", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            try:
+                if not _lock(handle):
+                    continue
+                entries = []
+                for line in handle:
+                    try:
+                        entries.append(_deserialize(line))
+                    except (ValueError, KeyError):
+                        logger.warning("Baris spool update_logs rusak diabaikan: %s", path)
+                if entries:
+                    self._insert(entries)
+                os.remove(path)
+                recovered += len(entries)
+            finally:
+                handle.close()
+        return recovered
+
+
+update_log_writer = UpdateLogWriter(
+    settings.LOG_WRITER_SPOOL_DIR,
+    settings.LOG_WRITER_BATCH_SIZE,
+    settings.LOG_WRITER_FLUSH_SECONDS,
+    settings.LOG_WRITER_FSYNC,
+)
+
+
+def write_log(db: Session, **fields):
+    """
+    Mencatat satu UpdateLog untuk transaksi `db`.
+    Mode "sync" (default): ditambahkan ke session dan ikut commit yang sama.
+    Mode "async": diserahkan ke update_log_writer setelah transaksi berhasil di-commit,
+    dan dibuang bila transaksi di-rollback atau session ditutup tanpa commit.
+    """
+    fields.setdefault("actor", "Admin")
+    if settings.LOG_WRITER_MODE == "sync":
+        db.add(UpdateLog(**fields))
+        return
+    # Waktu log = waktu request, bukan waktu flush; semua kolom diisi agar batch bisa insert multi-baris
+    fields.setdefault("created_at", datetime.now(timezone.utc))
+    db.info.setdefault(PENDING_KEY, []).append({name: fields.get(name) for name in LOG_FIELDS})
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _enqueue_committed_logs(session):
+    # Commit savepoint belum berarti transaksi utama ter-commit
+    if session.in_nested_transaction():
+        return
+    entries = session.info.pop(PENDING_KEY, None)
+    if entries:
+        update_log_writer.enqueue(entries)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_rolled_back_logs(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
+
+
+@event.listens_for(SessionLocal, "after_transaction_end")
+def _discard_uncommitted_logs(session, transaction):
+    # after_commit sudah mengambil entri transaksi yang berhasil; sisanya tidak pernah di-commit
+    if not transaction.nested:
+        session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,40 @@
+import sys
+import os
+import argparse
+
+# Setup environment agar bisa import app module
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.log_partitions import ensure_partitions, archive_logs
+
+def main():
+    parser = argparse.ArgumentParser(description="Arsipkan update_logs lama ke file CSV gzip per bulan")
+    parser.add_argument("--months", type=int, default=settings.LOG_RETENTION_MONTHS, help="Jumlah bulan log yang tetap disimpan di database")
+    parser.add_argument("--dir", default=settings.LOG_ARCHIVE_DIR, help="Folder tujuan arsip")
+    parser.add_argument("--dry-run", action="store_true", help="Tampilkan bulan yang akan diarsipkan tanpa mengubah data")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db)
+        for name in created:
+            print(f"✅ Partisi {name} dibuat.")
+
+        results = archive_logs(db, args.months, args.dir, dry_run=args.dry_run)
+        if not results:
+            print(f"✅ Tidak ada log yang lebih tua dari {args.months} bulan.")
+        for result in results:
+            if args.dry_run:
+                print(f"• {result['month']}: {result['rows']} log akan diarsipkan")
+            else:
+                print(f"✅ {result['month']}: {result['rows']} log diarsipkan ke {result['file']}")
+    except Exception as e:
+        print(f"❌ Terjadi error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
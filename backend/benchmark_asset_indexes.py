@@ -0,0 +1,144 @@
+import sys
+import os
+import argparse
+import time
+
+# Setup environment agar bisa import app module
+sys.path.append(os.getcwd())
+
+from sqlalchemy import text
+from app.db.session import engine
+
+# Benchmark dijalankan di schema terpisah agar tabel assets asli tidak disentuh
+BENCH_SCHEMA = "asset_index_bench"
+
+INDEXES = [
+    "CREATE INDEX ix_bench_school_id_created_at ON assets (school_id, created_at, id)",
+    "CREATE INDEX ix_bench_created_at ON assets (created_at, id)",
+    "CREATE INDEX ix_bench_type_code_category_code ON assets (type_code, category_code)",
+    "CREATE INDEX ix_bench_status ON assets (status)",
+    "CREATE INDEX ix_bench_ip_address ON assets (ip_address)",
+    "CREATE INDEX ix_bench_mac_address ON assets (mac_address)",
+]
+
+# Query yang mewakili jalur panas: daftar aset, filter tipe, validate_ip_mac, dashboard
+QUERIES = {
+    "list per sekolah (sort created_at)":
+        "SELECT * FROM assets WHERE school_id = 42 ORDER BY created_at DESC, id DESC LIMIT 10",
+    "list semua aset (sort created_at)":
+        "SELECT * FROM assets ORDER BY created_at DESC, id DESC LIMIT 10",
+    "filter type + category":
+        "SELECT * FROM assets WHERE type_code = 'NI' AND category_code = 'SWI' ORDER BY created_at DESC, id DESC LIMIT 10",
+    "validate_ip_mac (IP)":
+        "SELECT id FROM assets WHERE ip_address = '10.1.200.17' LIMIT 1",
+    "validate_ip_mac (MAC)":
+        "SELECT id FROM assets WHERE mac_address = '00:1A:2B:03:0D:40' LIMIT 1",
+    "count perlu perhatian":
+        "SELECT count(*) FROM assets WHERE status IN ('Rusak', 'Perbaikan', 'Terkendala')",
+}
+
+SEED_SQL = """
+INSERT INTO assets (
+    id, barcode, city_code, school_id, type_code, category_code, procurement_month, procurement_year,
+    floor, sequence_number, serial_number, brand, model_series, ip_address, mac_address, status, created_at
+)
+SELECT
+    g,
+    'BENCH-' || g,
+    '01',
+    1 + (g % 300),
+    (ARRAY['HW', 'NI', 'MP', 'PA', 'SD'])[1 + g % 5],
+    (ARRAY['LAP', 'PC', 'SWI', 'RTR', 'PRN', 'CCTV', 'ACC'])[1 + g % 7],
+    lpad((1 + g % 12)::text, 2, '0'),
+    lpad((g % 25)::text, 2, '0'),
+    lpad((g % 5)::text, 2, '0'),
+    lpad((g % 1000)::text, 3, '0'),
+    'SN' || g,
+    (ARRAY['Dell', 'Lenovo', 'HP', 'Asus', 'Cisco'])[1 + g % 5],
+    'Model ' || (g % 97),
+    '10.' || (g / 65536) % 256 || '.' || (g / 256) % 256 || '.' || g % 256,
+    upper(rpad(to_hex(g), 12, '0')),
+    (ARRAY['Berfungsi', 'Berfungsi', 'Berfungsi', 'Berfungsi', 'Berfungsi', 'Berfungsi', 'Rusak', 'Perbaikan', 'Terkendala', 'Dihapuskan'])[1 + g % 10],
+    now() - (g || ' minutes')::interval
+FROM generate_series(1, :rows) AS g
+"""
+
+
+def explain(conn, sql: str) -> tuple:
+    plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()
+    top = plan[0]
+    node = top["Plan"]
+    scans = []
+
+    def walk(n):
+        if "Relation Name" in n or "Index Name" in n:
+            scans.append(n["Node Type"] + (f" using {n['Index Name']}" if "Index Name" in n else ""))
+        for child in n.get("Plans", []):
+            walk(child)
+
+    walk(node)
+    return top["Execution Time"], ", ".join(scans) or node["Node Type"]
+
+
+def run_queries(conn, label: str) -> dict:
+    print(f"\n=== {label} ===")
+    results = {}
+    for name, sql in QUERIES.items():
+        explain(conn, sql)  # pemanasan cache
+        ms, plan = explain(conn, sql)
+        results[name] = ms
+        print(f"{name:<40} {ms:>10.2f} ms   {plan}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index komposit tabel assets (PostgreSQL)")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--keep", action="store_true", help="Jangan hapus schema benchmark setelah selesai")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        print("❌ Benchmark ini membutuhkan PostgreSQL (DATABASE_URL).")
+        return
+
+    with engine.connect() as conn:
+        # Seed dan CREATE INDEX bisa melebihi DB_STATEMENT_TIMEOUT_MS
+        conn.execute(text("SET statement_timeout = 0"))
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {BENCH_SCHEMA}"))
+        # Tanpa INCLUDING DEFAULTS agar sequence id tabel asli tidak ikut terpakai; id diisi manual
+        conn.execute(text(f"CREATE TABLE {BENCH_SCHEMA}.assets (LIKE public.assets)"))
+        conn.execute(text(f"ALTER TABLE {BENCH_SCHEMA}.assets ALTER COLUMN created_at SET DEFAULT now()"))
+        conn.execute(text(f"ALTER TABLE {BENCH_SCHEMA}.assets ADD PRIMARY KEY (id)"))
+        conn.execute(text(f"SET search_path TO {BENCH_SCHEMA}"))
+
+        started = time.perf_counter()
+        conn.execute(text(SEED_SQL), {"rows": args.rows})
+        conn.execute(text("ANALYZE assets"))
+        conn.commit()
+        print(f"Seed {args.rows:,} aset selesai dalam {time.perf_counter() - started:.1f} detik")
+
+        before = run_queries(conn, "SEBELUM index komposit")
+
+        started = time.perf_counter()
+        for ddl in INDEXES:
+            conn.execute(text(ddl))
+        conn.execute(text("ANALYZE assets"))
+        conn.commit()
+        print(f"\nMembuat {len(INDEXES)} index selesai dalam {time.perf_counter() - started:.1f} detik")
+
+        after = run_queries(conn, "SESUDAH index komposit")
+
+        print("\n=== Ringkasan ===")
+        for name in QUERIES:
+            speedup = before[name] / after[name] if after[name] else float("inf")
+            print(f"{name:<40} {before[name]:>10.2f} ms -> {after[name]:>8.2f} ms  ({speedup:,.0f}x)")
+
+        if not args.keep:
+            conn.execute(text("SET search_path TO public"))
+            conn.execute(text(f"DROP SCHEMA {BENCH_SCHEMA} CASCADE"))
+            conn.commit()
+
+
+if __name__ == "__main__":
+    main()
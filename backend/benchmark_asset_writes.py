@@ -0,0 +1,142 @@
+import sys
+import os
+import argparse
+import time
+
+# Setup environment agar bisa import app module
+sys.path.append(os.getcwd())
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import joinedload
+from app.db.session import SessionLocal
+from app.models.asset import Asset
+from app.models.location import School
+from app.models.update_log import UpdateLog
+from app.schemas.asset import AssetCreate, AssetUpdate, AssetResponse
+from app.schemas.user import UserPrincipal
+from app.services.dashboard_stats import stat_key, record_changes, record_update
+from app.services.log_writer import update_log_writer
+from app.api.v1.endpoints.assets import create_asset, update_asset
+
+# Aset benchmark memakai prefix barcode ini dan dihapus lagi di akhir
+BENCH_PREFIX = "BENCH-WRITE-"
+
+ACTOR = UserPrincipal(id=0, email="benchmark@local", full_name="Benchmark", role="admin", is_active=True)
+
+
+def legacy_create(db, asset_in: AssetCreate):
+    """Alur lama: commit aset, refresh, query lokasi, lalu commit kedua untuk log."""
+    new_asset = Asset(**asset_in.dict())
+    db.add(new_asset)
+    record_changes(db, added=[stat_key(new_asset)])
+    db.commit()
+    db.refresh(new_asset)
+    school = db.query(School).options(joinedload(School.area)).filter(School.id == new_asset.school_id).first()
+    db.add(UpdateLog(
+        asset_barcode=new_asset.barcode,
+        asset_name=f"{new_asset.brand} - {new_asset.model_series}",
+        action="CREATE",
+        details="Menambahkan aset baru ke database",
+        actor=ACTOR.full_name,
+        school_name=school.name,
+        area_name=school.area.name if school.area else "Unknown Area"
+    ))
+    db.commit()
+    return AssetResponse.model_validate(new_asset)
+
+
+def legacy_update(db, asset_id: int, asset_in: AssetUpdate):
+    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    old_key = stat_key(asset)
+    for field, value in asset_in.dict(exclude_unset=True).items():
+        setattr(asset, field, value)
+    db.add(asset)
+    record_update(db, old_key, stat_key(asset))
+    db.commit()
+    db.refresh(asset)
+    school = db.query(School).options(joinedload(School.area)).filter(School.id == asset.school_id).first()
+    db.add(UpdateLog(
+        asset_barcode=asset.barcode,
+        asset_name=f"{asset.brand} - {asset.model_series}",
+        action="UPDATE",
+        details="Memperbarui data aset",
+        actor=ACTOR.full_name,
+        school_name=school.name,
+        area_name=school.area.name if school.area else "Unknown Area"
+    ))
+    db.commit()
+    return AssetResponse.model_validate(asset)
+
+
+def asset_payload(school_id: int, barcode: str) -> AssetCreate:
+    return AssetCreate(
+        barcode=barcode, city_code="01", school_id=school_id, type_code="HW", category_code="PC",
+        procurement_month="01", procurement_year="25", floor="01", sequence_number="001",
+        serial_number=barcode, brand="Bench", model_series="Write"
+    )
+
+
+def timed(label: str, count: int, func) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{label:<28} {count:>6} edit  {elapsed:>8.2f} detik  {rate:>9.1f} edit/detik")
+    return rate
+
+
+def cleanup(db):
+    assets = db.query(Asset).filter(Asset.barcode.like(f"{BENCH_PREFIX}%")).all()
+    record_changes(db, removed=[stat_key(asset) for asset in assets])
+    db.execute(delete(UpdateLog).where(UpdateLog.asset_barcode.like(f"{BENCH_PREFIX}%")))
+    db.execute(delete(Asset).where(Asset.barcode.like(f"{BENCH_PREFIX}%")))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark edit/detik create & update aset: alur lama vs satu transaksi")
+    parser.add_argument("--edits", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        school_id = db.execute(select(School.id).order_by(School.id).limit(1)).scalar()
+        if not school_id:
+            print("❌ Belum ada data sekolah. Jalankan seed terlebih dahulu.")
+            return
+        cleanup(db)
+
+        print(f"=== Benchmark tulis aset ({args.edits} edit per skenario) ===")
+        before_create = timed(
+            "create (2 commit)", args.edits,
+            lambda i: legacy_create(db, asset_payload(school_id, f"{BENCH_PREFIX}L{i}"))
+        )
+        after_create = timed(
+            "create (1 transaksi)", args.edits,
+            lambda i: create_asset(asset_payload(school_id, f"{BENCH_PREFIX}N{i}"), db=db, current_user=ACTOR)
+        )
+
+        ids = [row.id for row in db.query(Asset.id).filter(Asset.barcode.like(f"{BENCH_PREFIX}%"))]
+        statuses = ["Rusak", "Berfungsi"]
+        before_update = timed(
+            "update (2 commit)", args.edits,
+            lambda i: legacy_update(db, ids[i % len(ids)], AssetUpdate(status=statuses[i % 2], room=f"R{i}"))
+        )
+        after_update = timed(
+            "update (1 transaksi)", args.edits,
+            lambda i: update_asset(ids[i % len(ids)], AssetUpdate(status=statuses[i % 2], room=f"R{i}"), db=db, current_user=ACTOR)
+        )
+
+        print("\n=== Ringkasan ===")
+        print(f"create: {before_create:.1f} -> {after_create:.1f} edit/detik ({after_create / before_create:.2f}x)")
+        print(f"update: {before_update:.1f} -> {after_update:.1f} edit/detik ({after_update / before_update:.2f}x)")
+    finally:
+        # Mode async: log alur baru ditulis oleh update_log_writer; flush dulu agar ikut dibersihkan
+        update_log_writer.stop()
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
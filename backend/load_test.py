@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+# Load test endpoint baca utama terhadap server yang sedang berjalan (uvicorn).
+# Membutuhkan httpx: pip install httpx
+import httpx
+
+ENDPOINTS = [
+    "/api/v1/assets/?size=20",
+    "/api/v1/assets/?size=20&search=lab&total_mode=estimate",
+    "/api/v1/logs/?size=20",
+    "/api/v1/services/?size=20",
+    "/api/v1/dashboard/stats",
+]
+
+
+async def worker(client: httpx.AsyncClient, paths: list, deadline: float, latencies: list, errors: list):
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run_level(base_url: str, paths: list, concurrency: int, duration: float) -> dict:
+    latencies, errors = [], []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(client, paths[n % len(paths):] + paths[:n % len(paths)], deadline, latencies, errors)
+            for n in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0,
+        "errors": len(errors),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load test endpoint baca (assets, logs, services, dashboard)")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", default="1,10,50,100", help="Daftar level concurrency, pisahkan dengan koma")
+    parser.add_argument("--duration", type=float, default=10, help="Durasi per level (detik)")
+    parser.add_argument("--barcode", help="Sertakan GET /assets/barcode/{barcode}")
+    args = parser.parse_args()
+
+    paths = list(ENDPOINTS)
+    if args.barcode:
+        paths.append(f"/api/v1/assets/barcode/{args.barcode}")
+
+    print(f"Target {args.url}, {len(paths)} endpoint, {args.duration:.0f} detik per level\n")
+    print(f"{'concurrency':>11} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'error':>6}")
+    for level in (int(c) for c in args.concurrency.split(",")):
+        result = await run_level(args.url, paths, level, args.duration)
+        print(
+            f"{level:>11} {result['requests']:>9} {result['rps']:>9.1f} "
+            f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['errors']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+import sys
+import os
+
+# Setup environment agar bisa import app module
+sys.path.append(os.getcwd())
+
+from app.db.session import SessionLocal
+from app.services.dashboard_stats import rebuild_stats
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = rebuild_stats(db)
+        print(f"✅ Statistik dashboard dibangun ulang ({rows} baris ringkasan).")
+    except Exception as e:
+        print(f"❌ Terjadi error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ sys.path.append(os.getcwd())
 
 from app.db.session import SessionLocal
 from app.models.master import MasterOption
+from app.core.http_cache import bump_version
 
 # DATA LENGKAP DARI assetData.js (Termasuk Subcategory)
 INITIAL_DATA = [
@@ -190,6 +191,8 @@ def seed_data():
                 db.add(new_opt)
                 count += 1
         
+        if count:
+            bump_version(db, "master_options")
         db.commit()
         print(f"Selesai! {count} data baru berhasil ditambahkan.")
     except Exception as e:
@@ -0,0 +1,77 @@
+import os
+import sys
+import tempfile
+
+# Database & direktori kerja test disiapkan sebelum modul app di-import (settings dibaca saat import)
+TEST_DIR = tempfile.mkdtemp(prefix="itam-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}"
+os.environ.pop("READ_DATABASE_URL", None)
+os.environ.setdefault("LOG_WRITER_MODE", "sync")
+os.environ["LOG_WRITER_SPOOL_DIR"] = os.path.join(TEST_DIR, "spool", "update_logs")
+os.environ["IMPORT_SPOOL_DIR"] = os.path.join(TEST_DIR, "imports")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import CACHES
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.main import app
+from app.models.location import Area, School
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    """
+    Database kosong untuk setiap test: satu area, dua sekolah, satu admin dan satu user biasa.
+    """
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    for cache in CACHES.values():
+        cache.invalidate()
+
+    db = SessionLocal()
+    area = Area(name="Pusat", slug="pusat")
+    db.add(area)
+    db.flush()
+    db.add_all([School(name="SDK 1", area_id=area.id), School(name="SMAK 1", area_id=area.id)])
+    db.add_all([
+        User(email="admin@test", full_name="Admin", hashed_password="x", role="admin", is_active=True),
+        User(email="user@test", full_name="User", hashed_password="x", role="user", is_active=True),
+    ])
+    db.commit()
+    db.close()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _headers(email: str) -> dict:
+    db = SessionLocal()
+    user_id = db.query(User.id).filter(User.email == email).scalar()
+    db.close()
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+@pytest.fixture
+def admin_headers():
+    return _headers("admin@test")
+
+
+@pytest.fixture
+def user_headers():
+    return _headers("user@test")
@@ -0,0 +1,56 @@
+import pytest
+
+from app.models.asset import Asset
+
+
+@pytest.fixture
+def assets(db):
+    rows = [
+        Asset(barcode=f"BK{i}", serial_number=f"BKS{i}", city_code="01", school_id=1, type_code="HW",
+              procurement_month="03", procurement_year="25", floor="01", sequence_number=f"{i:03d}", status="Berfungsi")
+        for i in range(3)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [asset.id for asset in rows]
+
+
+def test_bulk_update_changes_every_asset(client, admin_headers, db, assets):
+    response = client.patch(
+        "/api/v1/assets/bulk", headers=admin_headers,
+        json={"asset_ids": assets + [9999], "changes": {"status": "Rusak", "room": "LAB"}}
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+    assert response.json()["not_found"] == [9999]
+    db.expire_all()
+    assert {(asset.status, asset.room) for asset in db.query(Asset)} == {("Rusak", "LAB")}
+
+
+@pytest.mark.parametrize("field", ["status", "school_id", "city_code"])
+def test_bulk_update_rejects_null_for_required_column(client, admin_headers, db, assets, field):
+    response = client.patch(
+        "/api/v1/assets/bulk", headers=admin_headers,
+        json={"asset_ids": assets, "changes": {field: None}}
+    )
+    assert response.status_code == 400
+    assert field in response.json()["detail"]
+    db.expire_all()
+    assert {asset.status for asset in db.query(Asset)} == {"Berfungsi"}
+
+
+def test_bulk_update_allows_null_for_optional_column(client, admin_headers, assets):
+    response = client.patch(
+        "/api/v1/assets/bulk", headers=admin_headers,
+        json={"asset_ids": assets, "changes": {"room": None}}
+    )
+    assert response.status_code == 200
+
+
+def test_bulk_update_rejects_forbidden_fields_and_non_admin(client, admin_headers, user_headers, assets):
+    forbidden = client.patch("/api/v1/assets/bulk", headers=admin_headers,
+                             json={"asset_ids": assets, "changes": {"barcode": "X"}})
+    assert forbidden.status_code == 400
+    non_admin = client.patch("/api/v1/assets/bulk", headers=user_headers,
+                             json={"asset_ids": assets, "changes": {"status": "Rusak"}})
+    assert non_admin.status_code == 403
@@ -0,0 +1,45 @@
+import csv
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from app.models.asset import Asset
+
+
+@pytest.fixture
+def asset(db):
+    db.add(Asset(barcode="EX1", serial_number="EXS1", city_code="01", school_id=1, type_code="HW",
+                 procurement_month="03", procurement_year="25", floor="01", sequence_number="001",
+                 status="Berfungsi", username="guru", password="rahasia"))
+    db.commit()
+
+
+def _csv_rows(response):
+    return list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+
+
+def test_export_csv_hides_password_for_non_admin(client, user_headers, asset):
+    response = client.get("/api/v1/assets/export?format=csv", headers=user_headers)
+    assert response.status_code == 200
+    header, row = _csv_rows(response)
+    assert "Password" not in header
+    assert "rahasia" not in row
+    assert row[header.index("Username")] == "guru"
+    assert row[header.index("School Name")] == "SDK 1"
+    assert row[header.index("Area Name")] == "Pusat"
+
+
+def test_export_xlsx_hides_password_for_non_admin(client, user_headers, asset):
+    response = client.get("/api/v1/assets/export?format=xlsx", headers=user_headers)
+    assert response.status_code == 200
+    sheet = load_workbook(io.BytesIO(response.content))["Assets"]
+    header, row = list(sheet.iter_rows(values_only=True))
+    assert "Password" not in header
+    assert "rahasia" not in row
+
+
+def test_export_includes_password_for_admin(client, admin_headers, asset):
+    response = client.get("/api/v1/assets/export?format=csv", headers=admin_headers)
+    header, row = _csv_rows(response)
+    assert row[header.index("Password")] == "rahasia"
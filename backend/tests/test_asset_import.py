@@ -0,0 +1,111 @@
+import asyncio
+import io
+import time
+
+import pandas as pd
+import pytest
+
+from app.models.asset import Asset
+from app.services.asset_import import AssetImporter
+
+HEADER = ["Barcode", "Serial Number", "School ID", "City Code", "Type Code",
+          "Month", "Year", "Floor", "Sequence", "Brand", "IP Address", "MAC Address", "Status"]
+
+
+def rows(count: int = 5) -> list:
+    # MAC, IP, Brand dan Status dikosongkan kecuali di baris pertama
+    result = [["IMP0", "SN0", 1, "01", "HW", 3, 25, 1, 1, "HP", "10.0.0.1", "AA:BB:CC:DD:EE:00", "Berfungsi"]]
+    for i in range(1, count):
+        result.append([f"IMP{i}", f"SN{i}", 1, "01", "HW", 3, 25, 1, i + 1, None, None, None, None])
+    return result
+
+
+def xlsx_file(data: list) -> bytes:
+    buffer = io.BytesIO()
+    pd.DataFrame(data, columns=HEADER).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def csv_file(data: list) -> bytes:
+    return pd.DataFrame(data, columns=HEADER).to_csv(index=False).encode()
+
+
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def assert_imported(db, count: int):
+    assets = db.query(Asset).order_by(Asset.barcode).all()
+    assert len(assets) == count
+    assert all(asset.status == "Berfungsi" for asset in assets)
+    assert [asset.mac_address for asset in assets[1:]] == [None] * (count - 1)
+    assert [asset.ip_address for asset in assets[1:]] == [None] * (count - 1)
+
+
+def test_import_blank_cells(client, admin_headers, db):
+    response = client.post(
+        "/api/v1/assets/import", headers=admin_headers,
+        files={"file": ("assets.xlsx", xlsx_file(rows()), XLSX)}
+    )
+    assert response.status_code == 200
+    assert response.json()["errors"] == []
+    assert response.json()["success_count"] == 5
+    assert_imported(db, 5)
+
+
+def test_import_stream_csv_blank_cells(client, admin_headers, db):
+    response = client.post(
+        "/api/v1/assets/import/stream", headers=admin_headers,
+        files={"file": ("assets.csv", csv_file(rows()), "text/csv")}
+    )
+    assert response.status_code == 200
+    assert response.json()["errors"] == []
+    assert_imported(db, 5)
+
+
+def test_import_job_blank_cells(client, admin_headers, db):
+    response = client.post(
+        "/api/v1/assets/import/jobs", headers=admin_headers,
+        files={"file": ("assets.xlsx", xlsx_file(rows()), XLSX)}
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    for _ in range(100):
+        job = client.get(f"/api/v1/assets/import/jobs/{job_id}", headers=admin_headers).json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.05)
+    assert job["status"] == "completed"
+    assert job["success_count"] == 5
+    assert_imported(db, 5)
+
+
+def test_import_reports_duplicate_mac(client, admin_headers, db):
+    data = rows(3)
+    data[2][11] = data[0][11]
+    response = client.post(
+        "/api/v1/assets/import", headers=admin_headers,
+        files={"file": ("assets.xlsx", xlsx_file(data), XLSX)}
+    )
+    assert response.json()["success_count"] == 2
+    assert response.json()["errors"] == ["Baris 4: MAC Address 'AA:BB:CC:DD:EE:00' sudah digunakan aset lain."]
+
+
+def test_import_runs_off_the_event_loop(client, admin_headers, monkeypatch):
+    loops = []
+    original = AssetImporter.import_frame
+
+    def import_frame(self, df, row_numbers=None):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return original(self, df, row_numbers)
+
+    monkeypatch.setattr(AssetImporter, "import_frame", import_frame)
+    response = client.post(
+        "/api/v1/assets/import", headers=admin_headers,
+        files={"file": ("assets.xlsx", xlsx_file(rows(2)), XLSX)}
+    )
+    assert response.json()["success_count"] == 2
+    assert loops == [None]
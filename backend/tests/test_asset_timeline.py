@@ -0,0 +1,30 @@
+from app.models.asset import Asset
+from app.models.service_history import ServiceHistory
+from app.models.update_log import UpdateLog
+
+
+def add_logs(db, count: int, barcode: str):
+    # created_at dari server default (CURRENT_TIMESTAMP, tanpa mikrodetik): semua dalam detik yang sama
+    db.add_all([UpdateLog(asset_barcode=barcode, asset_name="x", action="UPDATE", details=f"log {i}", actor="A") for i in range(count)])
+    db.commit()
+
+
+def test_timeline_cursor_round_trip(client, db):
+    asset = Asset(barcode="TL1", serial_number="TLS1", city_code="01", school_id=1, type_code="HW",
+                  procurement_month="03", procurement_year="25", floor="01", sequence_number="001", status="Berfungsi")
+    db.add(asset)
+    db.commit()
+    add_logs(db, 5, barcode="TL1")
+    db.add_all([ServiceHistory(sn_or_barcode="TL1", asset_id=asset.id, issue_description=f"s{i}", vendor="V", status="Proses") for i in range(2)])
+    db.commit()
+
+    seen, cursor = [], None
+    for _ in range(20):
+        params = {"size": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/api/v1/assets/{asset.id}/timeline", params=params).json()
+        seen.extend((item["kind"], item["id"]) for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
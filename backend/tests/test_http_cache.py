@@ -0,0 +1,30 @@
+def test_master_options_etag_requires_auth(client, admin_headers):
+    first = client.get("/api/v1/master/", headers=admin_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/v1/master/", headers={**admin_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    anonymous = client.get("/api/v1/master/", headers={"If-None-Match": etag})
+    assert anonymous.status_code == 401
+
+
+def test_etag_changes_after_write(client, admin_headers):
+    etag = client.get("/api/v1/master/", headers=admin_headers).headers["etag"]
+    created = client.post(
+        "/api/v1/master/", headers=admin_headers,
+        json={"category": "CITY", "code": "01", "label": "Jakarta"}
+    )
+    assert created.status_code == 200
+
+    response = client.get("/api/v1/master/", headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [option["code"] for option in response.json()] == ["01"]
+
+
+def test_public_reference_data_still_revalidates(client):
+    first = client.get("/api/v1/areas/")
+    assert first.status_code == 200
+    assert client.get("/api/v1/areas/", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -0,0 +1,71 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.models.import_job import ImportJob
+from app.services.import_jobs import claim_import_job, recover_import_jobs, run_import_job
+
+
+def make_job(db, tmp_path, name: str, status: str, heartbeat_age: float = None, created_age: float = 0) -> ImportJob:
+    path = tmp_path / f"{name}.csv"
+    path.write_text("Barcode\n")
+    now = datetime.now(timezone.utc)
+    job = ImportJob(
+        filename=f"{name}.csv", file_path=str(path), actor="Admin", status=status,
+        rows_processed=0, success_count=0, error_count=0, errors=[],
+        created_at=now - timedelta(seconds=created_age),
+        started_at=now - timedelta(seconds=heartbeat_age) if heartbeat_age is not None else None,
+        heartbeat_at=now - timedelta(seconds=heartbeat_age) if heartbeat_age is not None else None,
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+def test_job_is_claimed_once(db, tmp_path):
+    job = make_job(db, tmp_path, "queued", "queued")
+    assert claim_import_job(db, job.id) is True
+    assert claim_import_job(db, job.id) is False
+
+    db.refresh(job)
+    assert job.status == "running"
+    assert job.worker and job.heartbeat_at is not None
+
+
+def test_run_skips_job_claimed_by_other_worker(db, tmp_path):
+    job = make_job(db, tmp_path, "busy", "running", heartbeat_age=1)
+    run_import_job(job.id)
+
+    db.refresh(job)
+    assert job.status == "running"
+    assert os.path.exists(job.file_path)
+
+
+def test_recover_only_fails_stale_running_jobs(db, tmp_path):
+    stale_age = settings.IMPORT_JOB_STALE_SECONDS + 60
+    live = make_job(db, tmp_path, "live", "running", heartbeat_age=1)
+    dead = make_job(db, tmp_path, "dead", "running", heartbeat_age=stale_age)
+    dead_path = dead.file_path
+
+    recover_import_jobs()
+    db.expire_all()
+
+    assert live.status == "running"
+    assert os.path.exists(live.file_path)
+    assert dead.status == "failed"
+    assert dead.file_path is None
+    assert not os.path.exists(dead_path)
+
+
+def test_recover_keeps_fresh_queued_job_without_local_file(db, tmp_path):
+    stale_age = settings.IMPORT_JOB_STALE_SECONDS + 60
+    fresh = make_job(db, tmp_path, "fresh", "queued")
+    old = make_job(db, tmp_path, "old", "queued", created_age=stale_age)
+    os.remove(fresh.file_path)
+    os.remove(old.file_path)
+
+    recover_import_jobs()
+    db.expire_all()
+
+    assert fresh.status == "queued"
+    assert old.status == "failed"
@@ -0,0 +1,102 @@
+import json
+import os
+
+import pytest
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.update_log import UpdateLog
+from app.services import log_writer
+from app.services.log_writer import UpdateLogWriter, write_log
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_WRITER_MODE", "async")
+    instance = UpdateLogWriter(str(tmp_path / "spool"), batch_size=500, flush_seconds=3600)
+    monkeypatch.setattr(log_writer, "update_log_writer", instance)
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def log_count(db, barcode: str) -> int:
+    db.expire_all()
+    return db.query(UpdateLog).filter(UpdateLog.asset_barcode == barcode).count()
+
+
+def add_log(session, barcode: str):
+    write_log(session, asset_barcode=barcode, asset_name="x", action="UPDATE", details="d")
+
+
+def test_sync_mode_logs_in_same_transaction(db):
+    assert settings.LOG_WRITER_MODE == "sync"
+    session = SessionLocal()
+    add_log(session, "SYNC-RB")
+    session.rollback()
+    add_log(session, "SYNC-OK")
+    session.commit()
+    session.close()
+    assert log_count(db, "SYNC-RB") == 0
+    assert log_count(db, "SYNC-OK") == 1
+
+
+def test_async_only_committed_transactions_are_logged(db, writer):
+    committed = SessionLocal()
+    add_log(committed, "A-OK")
+    committed.commit()
+    committed.close()
+
+    rolled_back = SessionLocal()
+    add_log(rolled_back, "A-RB")
+    rolled_back.rollback()
+    rolled_back.close()
+
+    never_committed = SessionLocal()
+    add_log(never_committed, "A-CLOSED")
+    never_committed.close()
+
+    outer_rollback = SessionLocal()
+    outer_rollback.query(UpdateLog).first()
+    add_log(outer_rollback, "A-SAVEPOINT")
+    with outer_rollback.begin_nested():
+        pass
+    outer_rollback.rollback()
+    outer_rollback.close()
+
+    spooled = [json.loads(line)["asset_barcode"] for line in open(writer._spool.name)]
+    assert spooled == ["A-OK"]
+
+    writer.flush()
+    assert [log_count(db, code) for code in ("A-OK", "A-RB", "A-CLOSED", "A-SAVEPOINT")] == [1, 0, 0, 0]
+
+
+def test_flush_survives_missing_spool_file(db, writer):
+    session = SessionLocal()
+    add_log(session, "A-MISSING")
+    session.commit()
+    session.close()
+
+    os.remove(writer._spool.name)
+    writer.flush()
+    assert log_count(db, "A-MISSING") == 1
+    assert os.path.exists(writer._spool.name)
+
+
+def test_recover_leftover_spool_of_dead_process(db, tmp_path):
+    spool_dir = tmp_path / "spool"
+    spool_dir.mkdir()
+    entry = {
+        "asset_barcode": "CRASH", "asset_name": "x", "school_name": None, "area_name": None,
+        "action": "UPDATE", "details": "d", "actor": "A", "created_at": "2026-10-18T01:00:00+00:00"
+    }
+    (spool_dir / "update_logs-99999-dead.jsonl").write_text(json.dumps(entry) + "\n" + '{"asset_barcode":"TRUNC')
+
+    writer = UpdateLogWriter(str(spool_dir), batch_size=500, flush_seconds=3600)
+    writer.start()
+    try:
+        assert log_count(db, "CRASH") == 1
+        assert not (spool_dir / "update_logs-99999-dead.jsonl").exists()
+    finally:
+        writer.stop()
+    assert os.listdir(spool_dir) == []
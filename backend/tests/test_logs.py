@@ -0,0 +1,27 @@
+from datetime import date, datetime, timezone
+
+from app.api.v1.endpoints.logs import log_conditions
+from app.models.update_log import UpdateLog
+
+
+def test_date_filters_use_utc_bounds():
+    lower, upper = log_conditions(date_from=date(2026, 3, 1), date_to=date(2026, 3, 2))
+    assert lower.right.value == datetime(2026, 3, 1, tzinfo=timezone.utc)
+    assert upper.right.value == datetime(2026, 3, 3, tzinfo=timezone.utc)
+
+
+def test_date_filters_are_inclusive(client, db):
+    db.add_all([
+        UpdateLog(asset_barcode=f"DT{i}", asset_name="x", action="UPDATE", details="", actor="A",
+                  created_at=datetime(2026, 3, day, hour, 30, tzinfo=timezone.utc))
+        for i, (day, hour) in enumerate([(1, 0), (2, 23), (3, 0), (4, 12)])
+    ])
+    db.commit()
+    response = client.get("/api/v1/logs/", params={"date_from": "2026-03-01", "date_to": "2026-03-03", "size": 10})
+    assert response.status_code == 200
+    assert sorted(item["asset_barcode"] for item in response.json()["items"]) == ["DT0", "DT1", "DT2"]
+
+
+def test_date_from_after_date_to_is_rejected(client):
+    response = client.get("/api/v1/logs/", params={"date_from": "2026-03-02", "date_to": "2026-03-01"})
+    assert response.status_code == 400
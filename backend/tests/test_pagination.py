@@ -0,0 +1,61 @@
+from datetime import date
+
+from app.models.asset import Asset
+from app.models.service_history import ServiceHistory
+from app.models.update_log import UpdateLog
+
+
+def add_logs(db, count: int, barcode: str = "PG1"):
+    # created_at dari server default (CURRENT_TIMESTAMP, tanpa mikrodetik): semua dalam detik yang sama
+    db.add_all([UpdateLog(asset_barcode=barcode, asset_name="x", action="UPDATE", details=f"log {i}", actor="A") for i in range(count)])
+    db.commit()
+
+
+def walk(client, url: str, size: int) -> list:
+    seen, cursor = [], None
+    for _ in range(20):
+        params = {"size": size, **({"cursor": cursor} if cursor else {})}
+        page = client.get(url, params=params).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return seen
+    raise AssertionError("cursor tidak pernah habis")
+
+
+def test_log_cursor_round_trip(client, db):
+    add_logs(db, 7)
+    ids = walk(client, "/api/v1/logs/", 3)
+    assert len(ids) == 7
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_asset_cursor_round_trip(client, db):
+    db.add_all([
+        Asset(barcode=f"PG{i}", serial_number=f"PGS{i}", city_code="01", school_id=1, type_code="HW", procurement_month="03",
+              procurement_year="25", floor="01", sequence_number=f"{i:03d}", status="Berfungsi")
+        for i in range(5)
+    ])
+    db.commit()
+    ids = walk(client, "/api/v1/assets/", 2)
+    assert sorted(ids) == [asset.id for asset in db.query(Asset).order_by(Asset.id)]
+
+
+def test_invalid_page_size_is_rejected(client):
+    for url in ("/api/v1/assets/", "/api/v1/logs/", "/api/v1/services/"):
+        assert client.get(url, params={"size": 0}).status_code == 422
+        assert client.get(url, params={"size": -1}).status_code == 422
+        assert client.get(url, params={"page": 0}).status_code == 422
+        assert client.get(url, params={"size": 1000}).status_code == 200
+
+
+def test_service_cursor_round_trip_with_duplicate_and_missing_dates(client, db):
+    dates = [date(2026, 1, 5), date(2026, 1, 5), None, date(2026, 2, 1), None]
+    db.add_all([
+        ServiceHistory(sn_or_barcode=f"SV{i}", service_date=day, issue_description=f"s{i}", vendor="V", status="Proses")
+        for i, day in enumerate(dates)
+    ])
+    db.commit()
+    for order in ("desc", "asc"):
+        ids = walk(client, f"/api/v1/services/?sort_order={order}", 2)
+        assert sorted(ids) == [service.id for service in db.query(ServiceHistory).order_by(ServiceHistory.id)]